@@ -1,40 +1,316 @@
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
 import time
+import random
 import os
 import sys
 import argparse
 from urllib.parse import urlencode
 import sqlite3
 import json
+import gzip
+import hashlib
 import re
 from pathlib import Path
-import glob
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from itertools import islice
+
+# lxml is a C-backed tree builder; it parses pages several times faster than
+# the pure-Python "html.parser" while keeping the BeautifulSoup API used below.
+HTML_PARSER = "lxml"
+
+# Search result pages are only read for their links, so only <a> tags are built
+LINKS_ONLY = SoupStrainer("a")
+
+# Number of scraped cases buffered before they are written in one transaction
+BATCH_SIZE = 500
+
+# Default number of concurrent HTTP requests kept in flight against nkp.gov.np
+MAX_WORKERS = 8
+
+# Default cap on requests started per second against nkp.gov.np, across all workers
+REQUESTS_PER_SECOND = 5
+
+# Case pages fetched ahead of the parser in run_scraper; bounds the HTML held in memory
+PREFETCH_DEPTH = 32
+
+# Failed downloads are retried only for statuses that can clear up on their
+# own, after a jittered exponential backoff (or the server's Retry-After)
+RETRYABLE_STATUS_CODES = frozenset((408, 429, 500, 502, 503, 504))
+RETRY_BASE_DELAY = 1  # seconds, doubled after each attempt
+RETRY_MAX_DELAY = 60
+
+# List fields are stored as JSON text with Devanagari kept as-is; one shared
+# encoder avoids json.dumps building a new one for every field of every row
+JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+# Part of every page digest; bump it whenever parsing changes, so pages that
+# were already parsed are parsed again on the next run
+PARSER_VERSION = 1
+
+# One fixed statement text, so sqlite3 compiles it once and reuses it from
+# the connection's statement cache for every batch
+INSERT_CASE_SQL = '''
+    INSERT OR REPLACE INTO cases (
+        लिङ्क, निर्णय_नं, भाग, मुद्दाको_किसिम, साल, महिना, अंक, फैसला_मिति,
+        अदालत_वा_इजलास, न्यायाधीश, आदेश_मिति, केस_नम्बर, विषय, निवेदक, विपक्षी,
+        प्रकरण, ठहर, html_file_path
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Devanagari digits -> ASCII digits, applied with str.translate
+NEPALI_TO_ENGLISH_DIGITS = str.maketrans('०१२३४५६७८९', '0123456789')
+
+# Labelled fields of a case page's edition-info block, in column order
+EDITION_LABELS = ("भाग", "साल", "महिना", "अंक")
+
+# Trailing case number of a full_detail URL, and saved-page filenames
+_LINK_NUM_RE = re.compile(r'/(\d+)/?$')
+_FNAME_RE = re.compile(r'(\d+)_(\d+)_(\d+)\.html(?:\.gz)?')
+
+def tag_text(tag, separator):
+    """tag.get_text(separator=separator, strip=True), without the join for a lone text node"""
+    # Most judgment paragraphs hold a single string; get_text would still
+    # collect and join it. Comments and other string subclasses take the
+    # full path so they stay excluded exactly as get_text excludes them.
+    string = tag.string
+    if type(string) is NavigableString:
+        return string.strip()
+    return tag.get_text(separator=separator, strip=True)
+
+
+def next_tag_sibling(tag):
+    """tag.find_next_sibling(), walking .next_sibling directly instead of through a SoupStrainer"""
+    sibling = tag.next_sibling
+    while sibling is not None and not isinstance(sibling, Tag):
+        sibling = sibling.next_sibling
+    return sibling
+
+
+def _trie_pattern(words):
+    """Build a regex alternation of words with shared prefixes merged"""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node):
+        branches = [re.escape(ch) + build(child) for ch, child in node.items() if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class RateLimiter:
+    """Space calls to wait() at least 1/rate seconds apart, across threads"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def wait(self):
+        # Reserve the next free start time under the lock, then sleep outside it
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_time)
+            self._next_time = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class KeywordSet:
+    """One role's marker keywords, matched against paragraph text.
+
+    The alternation regex scans the text once instead of running one
+    ``in`` check per keyword; merging shared prefixes keeps it from
+    retrying every keyword at each position.
+    """
+
+    def __init__(self, keywords):
+        self.keywords = keywords
+        self.exact = frozenset(keywords)
+        self.pattern = re.compile(_trie_pattern(keywords))
+
+    def occurs_in(self, text):
+        return self.pattern.search(text) is not None
+
+    def starts(self, text):
+        return text.startswith(self.keywords)
+
+    def equals(self, text):
+        return text in self.exact
+
+
+class KeywordTable(dict):
+    """An era's keyword groups, keyed by role"""
+
+    def __init__(self, groups):
+        super().__init__((group, KeywordSet(keywords)) for group, keywords in groups.items())
+
+
+# Marker keywords per publication era, keyed by role:
+# 2 = प्रकरण markers, 3 = appellant, 4 = opponent, 5 = subject, 6 = bench,
+# 7 = order/decision date, 8 = judge, 9 = versus, 10 = case number codes,
+# 11 = prakaran markers that end a multi-party listing
+KEYWORDS_2015_TO_2044 = KeywordTable({
+    2: ("(प्रकरण नं", "(प्रकारण नं.", "९प्रकरण नं।", "(प्रकरण", "(प्र नं.", "( प्र. नं", "(प्र.नं", "(प्र. नं", "( प्रकरण नं.", "( प्रकरणन", "( प्र.नं.", "( प्र . नं .", "( प ्र . नं .", "(प्ररकण नं.", "(प्रकराण नं."),
+    3: ("निवेदक", "वादी", "पुनरावेदक", "निबेदक", "पुनरावदेक", "निवेदिका", "निवेदीका", "निवदेक", "न ि वेदक ः", "नि वेदक ः", "पुनरावेदन", "पुनरवेदिका", "पुनरावेदिका", "पुनरावेदीका", "बादि", "पुनराबेदक", "प्रतिबादी", "पुनरावेक", "अपीलाट", "निवेदनक", "उजुरवाला", "अपिलबाट", "अपिलाट"),
+    4: ("विपक्षी", "प्रतिवादी", "प्रत्यर्थी", "बिपक्षी", "विपक्षी ः", "पिपक्षी", "विरुद्ध", "प्रत्यार्थी", "विरूद्ध", "बिरूद्ध", "विपक्ष", "रेस्पोण्डेण्ट", "रेस्पोन्डेन्ट"),
+    5: ("विषय", "मुद्दा", "बिषय", "मूद्दा", "मुद्द", "मद्दा", "विपक्ष", "मुद्धा"),
+    6: ("इजलास", "इजालास", "इजलाश", "बेञ्च"),
+    7: ("आदेश", "फैसला", "फैसलमा", "निर्णय", "फै सला"),
+    8: ("न्यायाधीश", "माननीय", "न्यायधीश", "न्यायाधीस", "न्ययाधीश", "न्यायाधिश", "न्यायाधी", "न्यानायधीश", "नयायाधीश", "न्यायाधधिश", "नयाधश"),
+})
+KEYWORDS_2045_TO_2050 = KeywordTable({
+    2: ("(प्ररकण नं.", "(प्रकरण नं", "(प्रकारण नं.", "९प्रकरण नं।", "(प्रकरण", "( प्र. नं", "(प्र.नं", "(प्र. नं", "( प्रकरण नं.", "( प्रकरणन", "( प्र.नं.", "( प्र . नं .", "( प ्र . नं ."),
+    3: ("निवेदक", "वादी", "पुनरावेदक", "निबेदक", "पुनरावदेक", "निवेदिका", "निवदेक", "न ि वेदक ः", "नि वेदक ः", "पुनरावेदन", "पुनरवेदिका", "बादि", "पुनराबेदक", "प्रतिबादी"),
+    4: ("विपक्षी", "प्रतिवादी", "प्रत्यर्थी", "बिपक्षी", "विपक्षी ः", "पिपक्षी", "विरुद्ध", "प्रत्यार्थी"),
+    5: ("विषय", "मुद्दा", "बिषय", "मूद्दा"),
+    6: ("इजलास", "इजालास", "इजलाश"),
+    7: ("आदेश", "फैसला", "फैसलमा", "निर्णय"),
+    8: ("न्यायाधीश", "माननीय"),
+})
+KEYWORDS_2051_TO_2061 = KeywordTable({
+    2: ("(प्रकरण नं", "(प्रकारण नं.", "९प्रकरण नं।", "(प्रकरण", "( प्र. नं", "(प्र.नं", "( प्रकरण नं.", "( प्रकरणन", "( प्र.नं.", "( प्र. नं.", "( प्र . नं .", "( प ्र . नं ."),
+    3: ("निवेदक", "वादी", "पुनरावेदक", "निबेदक", "पुनरावदेक", "निवेदिका", "निवदेक", "न ि वेदक ः", "नि वेदक ः", "पुनरावेदन", "पुनरवेदिका", "बादि"),
+    4: ("विपक्षी", "प्रतिवादी", "प्रत्यर्थी", "बिपक्षी", "विपक्षी ः", "पिपक्षी"),
+    5: ("विषय", "मुद्दा", "बिषय", "मूद्दाः"),
+    6: ("इजलास", "इजालास"),
+    7: ("आदेश", "फैसला", "फैसलमा", "निर्णय"),
+    8: ("न्यायाधीश", "माननीय"),
+})
+KEYWORDS_2062_TO_2072 = KeywordTable({
+    2: ("प्रकरण नं.", "(प्रकरण नं", "(प्रकारण नं.", "९प्रकरण नं।", "(प्रकरण", "(प्र नं.", "( प्र. नं", "(प्र.नं", "(प्र. नं", "( प्रकरण नं.", "( प्रकरणन", "( प्र.नं.", "( प्र . नं .", "( प ्र . नं .", "(प्ररकण नं.", "(प्रकराण नं."),
+    3: ("निवेदक", "वादी", "पुनरावेदक", "निबेदक", "पुनरावदेक", "निवेदिका", "निवेदीका", "निवदेक", "न ि वेदक ः", "नि वेदक ः", "पुनरावेदन", "पुनरवेदिका", "पुनरावेदिका", "पुनरावेदीका", "बादि", "पुनराबेदक", "प्रतिबादी", "पुनरावेक", "अपीलाट", "निवेदनक", "उजुरवाला", "अपिलबाट", "अपिलाट"),
+    4: ("विपक्षी", "प्रतिवादी", "प्रत्यर्थी", "बिपक्षी", "विपक्षी ः", "पिपक्षी", "प्रत्यार्थी", "विपक्ष", "रेस्पोण्डेण्ट", "रेस्पोन्डेन्ट", "प्रत्यथी"),
+    5: ("विषय", "मुद्दा", "बिषय", "मूद्दा", "मुद्द", "मद्दा", "विपक्ष", "मुद्धा", "मुद् दा"),
+    6: ("अदालत", "इजलास", "इजालास", "इजलाश", "बेञ्च"),
+    7: ("आदेश", "फैसला", "फैसलमा", "निर्णय", "फै सला", "मुद्दा"),
+    8: ("न्यायाधीश", "माननीय", "न्यायधीश", "न्यायाधीस", "न्ययाधीश", "न्यायाधिश", "न्यायाधी", "न्यानायधीश", "नयायाधीश", "न्यायाधधिश", "नयाधश"),
+    9: ("विरूद्ध", "बिरूद्ध", "विरुद्ध", "बिरुद्ध"),
+    10: ("AP", "FN", "RE", "RI", "LE", "RV", "NF", "CI", "CR", "RC", "SA", "MS", "ND", "RB", "CF", "DF", "RF", "WO", "WH", "WS", "WF", "WC", "CC", "EC"),
+})
+KEYWORDS_2073_TO_2080 = KeywordTable({
+    2: ("(प्रकरण नं", "(प्रकारण नं.", "९प्रकरण नं।", "(प्रकरण", "(प्र.नं."),
+    3: ("निवेदक", "प्रतिवादी", "पुनरावेदक"),
+    4: ("विपक्षी", "वादी", "प्रत्यर्थी"),
+    5: ("विषय", "मुद्दा"),
+    7: ("आदेश मिति", "फैसला मिति"),
+    11: ("(प्रकरण नं", "(प्रकारण नं.", "९प्रकरण नं।", "(प्रकरण"),
+})
+
+# Id of the judgment block on case pages; pages without it are error or
+# placeholder pages and are not worth parsing
+CASE_PAGE_MARKER = "faisala_detail"
+
+# Paragraphs that open the verdict (tahar) section of a judgment
+VERDICT_MARKERS = frozenset(("फैसला", "आदेश", "फैसलाः"))
+
+# Per-era options for the shared case-page scraper. The header layout of each
+# era is read by its own LegalCaseScraper._extract_header_* method; these flags
+# cover how the remaining body is split into prakarans.
+ERA_2015_TO_2044 = {
+    "years": (2015, 2044),
+    "keywords": KEYWORDS_2015_TO_2044,
+    "detail_tags": ["h1", "p"],
+    "text_separator": " ",
+    "skip_known": True,
+    "probe_status": False,
+    "prakaran_at_start": False,
+    "split_on_section_mark": True,
+    "split_on_verdict": True,
+    "keep_empty_prev": False,
+    "verdict_markers": VERDICT_MARKERS,
+}
+ERA_2045_TO_2050 = dict(ERA_2015_TO_2044, years=(2045, 2050), keywords=KEYWORDS_2045_TO_2050, split_on_verdict=False)
+ERA_2051_TO_2061 = dict(ERA_2045_TO_2050, years=(2051, 2061), keywords=KEYWORDS_2051_TO_2061)
+ERA_2062_TO_2072 = dict(ERA_2015_TO_2044, years=(2062, 2072), keywords=KEYWORDS_2062_TO_2072, prakaran_at_start=True)
+ERA_2073_TO_2080 = {
+    "years": (2073, 2080),
+    "keywords": KEYWORDS_2073_TO_2080,
+    "detail_tags": ["p"],
+    "text_separator": "",
+    "skip_known": False,
+    "probe_status": True,
+    "prakaran_at_start": False,
+    "split_on_section_mark": False,
+    "split_on_verdict": False,
+    "keep_empty_prev": True,
+    "verdict_markers": frozenset(("फैसला", "आदेश")),
+}
+ERAS = (ERA_2015_TO_2044, ERA_2045_TO_2050, ERA_2051_TO_2061, ERA_2062_TO_2072, ERA_2073_TO_2080)
 
 class LegalCaseScraper:
-    def __init__(self, output_db="legal_cases_2.db", html_folder="scraped_html"):
-        self.mudda_type_arr = [
-            "दुनियाबादी देवानी", 
-            "सरकारबादी देवानी", 
-            "दुनियावादी फौजदारी", 
-            "सरकारवादी फौजदारी", 
-            "रिट", 
-            "निवेदन", 
-            "विविध"
-        ]
+    # Case types in the order of their nkp.gov.np mudda_type numbers (1-7);
+    # class-level so they can be listed without opening a database
+    mudda_type_arr = [
+        "दुनियाबादी देवानी", 
+        "सरकारबादी देवानी", 
+        "दुनियावादी फौजदारी", 
+        "सरकारवादी फौजदारी", 
+        "रिट", 
+        "निवेदन", 
+        "विविध"
+    ]
+    mudda_type_numbers = {name: str(idx + 1) for idx, name in enumerate(mudda_type_arr)}
+
+    def __init__(self, output_db="legal_cases_2.db", html_folder="scraped_html", max_workers=MAX_WORKERS, rate=REQUESTS_PER_SECOND):
         self.successful_entries = 0
         self.not_entered_links = []
         self.still_not_entered_links = []
         self.output_db = output_db
         self.html_folder = html_folder
+        self._html_folder_prefix = os.path.join(html_folder, "")
+        self.max_workers = max_workers
+        self._pending_cases = []
+        self._pending_digests = []
+        self._eras_by_sal = {}
         
         # Create HTML folder if it doesn't exist
         os.makedirs(self.html_folder, exist_ok=True)
         
+        # Reuse pooled keep-alive connections instead of a new TLS handshake per page;
+        # at most max_workers requests are in flight, so that many connections are kept
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=max_workers, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        })
+        # Result-page and case-page fetches run on separate pools at the same
+        # time; these slots keep their combined requests within max_workers
+        self._request_slots = threading.BoundedSemaphore(max_workers)
+        self._rate_limiter = RateLimiter(rate)
+        
         # Initialize SQLite database
         self.conn = sqlite3.connect(self.output_db)
+        self.configure_connection()
         self.create_tables()
+        
+        # Links already stored or queued, so duplicates are skipped without a query
+        self._known_links = {row[0] for row in self.conn.execute('SELECT लिङ्क FROM cases')}
+        # Digest of the page each stored row was parsed from
+        self._page_digests = dict(self.conn.execute('SELECT लिङ्क, html_digest FROM parsed_pages'))
+
+    def configure_connection(self):
+        """Tune SQLite for the scraper's single-writer, bulk-insert workload"""
+        # WAL with synchronous=NORMAL avoids an fsync on every commit; a crash
+        # can lose at most the last batch, which a re-run simply scrapes again
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+        self.conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
 
     def create_tables(self):
         """Create SQLite tables for scraped data and failed links"""
@@ -79,46 +355,52 @@ class LegalCaseScraper:
             )
         ''')
 
+        # Which page content (and parser version) each stored case came from
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS parsed_pages (
+                लिङ्क TEXT PRIMARY KEY,
+                html_digest TEXT
+            )
+        ''')
+
         self.conn.commit()
 
     def get_mudda_type_number(self, mudda_type):
         """Get mudda type number (1-7) from mudda type name"""
         try:
-            return str(self.mudda_type_arr.index(mudda_type) + 1)
-        except ValueError:
+            return self.mudda_type_numbers[mudda_type]
+        except KeyError:
             raise ValueError(f"Invalid mudda_type: {mudda_type}. Must be one of {self.mudda_type_arr}")
 
     def extract_link_number(self, url):
         """Extract the number at the end of the URL"""
-        match = re.search(r'/(\d+)/?$', url)
+        match = _LINK_NUM_RE.search(url)
         return match.group(1) if match else "unknown"
 
     def generate_html_filename(self, url, mudda_type, sal):
-        """Generate standardized HTML filename: mudda_number_year_link_number.html"""
+        """Generate standardized HTML filename: mudda_number_year_link_number.html.gz"""
         mudda_number = self.get_mudda_type_number(mudda_type)
         english_sal = self.nepali_sal_to_english_sal(sal)
         link_number = self.extract_link_number(url)
-        return f"{mudda_number}_{english_sal}_{link_number}.html"
+        return f"{mudda_number}_{english_sal}_{link_number}.html.gz"
+
+    def html_file_path(self, url, mudda_type, sal):
+        """Path of the saved HTML file for a case inside the HTML folder"""
+        return self._html_folder_prefix + self.generate_html_filename(url, mudda_type, sal)
 
     def nepali_sal_to_english_sal(self, sal):
         """Convert Nepali numerals to English numerals"""
         if not sal:
             return ""
         
-        nepali_to_english = {
-            '०': '0', '१': '1', '२': '2', '३': '3', '४': '4',
-            '५': '5', '६': '6', '७': '7', '८': '8', '९': '9'
-        }
         try:
-            return ''.join(nepali_to_english.get(char, char) for char in str(sal))
+            return str(sal).translate(NEPALI_TO_ENGLISH_DIGITS)
         except (TypeError, AttributeError):
             raise ValueError(f"Input must be a string containing Nepali numerals, got: {type(sal)}")
     
     def search_url(self, mudda_type, sal):
         """Generate search URL based on mudda_type and sal"""
-        mudda_types = {name: str(idx + 1) for idx, name in enumerate(self.mudda_type_arr)}
-        
-        if mudda_type not in mudda_types:
+        if mudda_type not in self.mudda_type_numbers:
             raise ValueError(f"Invalid mudda_type: {mudda_type}. Must be one of {self.mudda_type_arr}")
         
         english_sal = self.nepali_sal_to_english_sal(sal)
@@ -127,7 +409,7 @@ class LegalCaseScraper:
             "mudda_number": "",
             "faisala_date_from": "",
             "faisala_date_to": "",
-            "mudda_type": mudda_types[mudda_type],
+            "mudda_type": self.mudda_type_numbers[mudda_type],
             "mudda_name": "",
             "badi": "",
             "pratibadi": "",
@@ -146,82 +428,146 @@ class LegalCaseScraper:
     
     def save_html_file(self, url, html_content, mudda_type, sal):
         """Save HTML content to file with standardized naming"""
-        filename = self.generate_html_filename(url, mudda_type, sal)
-        filepath = os.path.join(self.html_folder, filename)
+        filepath = self.html_file_path(url, mudda_type, sal)
         
-        with open(filepath, "w", encoding="utf-8") as f:
+        # Write to a private temp file and swap it in, so concurrent fetches
+        # of pages sharing a filename never leave a half-written file behind
+        temp_path = f"{filepath}.{threading.get_ident()}.tmp"
+        with gzip.open(temp_path, "wt", encoding="utf-8", compresslevel=6) as f:
             f.write(html_content)
+        os.replace(temp_path, filepath)
         
         return filepath
 
     def load_html_file(self, url, mudda_type, sal):
         """Load HTML content from existing file"""
-        filename = self.generate_html_filename(url, mudda_type, sal)
-        filepath = os.path.join(self.html_folder, filename)
+        filepath = self.html_file_path(url, mudda_type, sal)
+        
+        # Open directly rather than stat first; a missing file is the common miss
+        try:
+            with gzip.open(filepath, "rt", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            pass
         
-        if os.path.exists(filepath):
-            with open(filepath, "r", encoding="utf-8") as f:
+        # Pages saved before compression was introduced
+        try:
+            with open(filepath[:-len(".gz")], "r", encoding="utf-8") as f:
                 return f.read()
+        except FileNotFoundError:
+            return None
+
+    def parse_html(self, html_content, parse_only=None):
+        """Build a soup object from raw HTML using the fast lxml parser"""
+        return BeautifulSoup(html_content, HTML_PARSER, parse_only=parse_only)
+
+    def load_saved_html(self, url, mudda_type=None, sal=None, marker=None):
+        """Get raw HTML from the saved file, or None if there is no usable copy"""
+        # A saved copy that lacks the marker is ignored, so it is fetched again
+        if mudda_type and sal:
+            html_content = self.load_html_file(url, mudda_type, sal)
+            if html_content and (marker is None or marker in html_content):
+                print(f"Using saved HTML file for {url}")
+                return html_content
         return None
 
-    def return_soup(self, url, mudda_type=None, sal=None, use_saved=True, max_retries=3):
-        """Get soup object from URL or saved HTML file"""
+    def html_from_response(self, r, url, mudda_type=None, sal=None, marker=None):
+        """Get raw HTML from a successful response, saving it when mudda_type and sal are known"""
+        # Pages without the marker are rejected before parsing
+        if marker is not None and marker.encode() not in r.content:
+            print(f"No case content found at {url}, skipping parse")
+            return None
+        r.encoding = 'utf-8'
+        
+        # Save HTML file if mudda_type and sal are provided
+        if mudda_type and sal:
+            filepath = self.save_html_file(url, r.text, mudda_type, sal)
+            print(f"Saved HTML to: {filepath}")
+        
+        return r.text
+
+    def http_get(self, url, timeout=30):
+        """GET a URL through the shared session, holding one of the max_workers request slots"""
+        with self._request_slots:
+            self._rate_limiter.wait()
+            return self.session.get(url, timeout=timeout)
+
+    def retry_delay(self, attempt, response=None):
+        """Seconds to wait before retrying a download that failed on the given attempt"""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return min(int(retry_after), RETRY_MAX_DELAY)
+        # Jitter keeps the worker threads from retrying in lockstep
+        delay = min(RETRY_BASE_DELAY * 2 ** attempt, RETRY_MAX_DELAY)
+        return delay + random.uniform(0, RETRY_BASE_DELAY)
+
+    def fetch_html(self, url, mudda_type=None, sal=None, use_saved=True, max_retries=3, marker=None):
+        """Get raw HTML from saved file or URL"""
         # Try to load from saved file first if requested
-        if use_saved and mudda_type and sal:
-            html_content = self.load_html_file(url, mudda_type, sal)
+        if use_saved:
+            html_content = self.load_saved_html(url, mudda_type, sal, marker)
             if html_content:
-                print(f"Using saved HTML file for {url}")
-                return BeautifulSoup(html_content, 'html.parser')
+                return html_content
         
         # Download from web if not found in saved files or use_saved is False
         for attempt in range(max_retries):
             try:
-                r = requests.get(url, timeout=30, headers={
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                })
+                r = self.http_get(url, timeout=30)
                 if r.status_code == 200:
-                    r.encoding = 'utf-8'
-                    
-                    # Save HTML file if mudda_type and sal are provided
-                    if mudda_type and sal:
-                        filepath = self.save_html_file(url, r.text, mudda_type, sal)
-                        print(f"Saved HTML to: {filepath}")
-                    
-                    return BeautifulSoup(r.text, 'html.parser')
+                    return self.html_from_response(r, url, mudda_type, sal, marker)
                 else:
                     print(f"Attempt {attempt + 1}: Failed to retrieve {url}. Status code: {r.status_code}")
+                    if r.status_code not in RETRYABLE_STATUS_CODES:
+                        break
                     if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)
+                        time.sleep(self.retry_delay(attempt, r))
                     
             except requests.exceptions.RequestException as e:
                 print(f"Attempt {attempt + 1}: Error scraping {url}: {e}")
                 if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
+                    time.sleep(self.retry_delay(attempt))
                     
         return None
 
+    def return_soup(self, url, mudda_type=None, sal=None, use_saved=True, max_retries=3, marker=None, parse_only=None):
+        """Get soup object from URL or saved HTML file"""
+        html_content = self.fetch_html(url, mudda_type, sal, use_saved, max_retries, marker)
+        return self.parse_html(html_content, parse_only) if html_content else None
+
     def get_saved_html_files_by_criteria(self, mudda_type=None, sal=None):
         """Get list of saved HTML files matching criteria"""
-        pattern = "*"
-        
+        prefix, infix, suffix = "", "", ""
         if mudda_type and sal:
             mudda_number = self.get_mudda_type_number(mudda_type)
             english_sal = self.nepali_sal_to_english_sal(sal)
-            pattern = f"{mudda_number}_{english_sal}_*.html"
+            prefix, suffix = f"{mudda_number}_{english_sal}_", ".html"
         elif sal:
             english_sal = self.nepali_sal_to_english_sal(sal)
-            pattern = f"*_{english_sal}_*.html"
+            infix, suffix = f"_{english_sal}_", ".html"
         elif mudda_type:
             mudda_number = self.get_mudda_type_number(mudda_type)
-            pattern = f"{mudda_number}_*_*.html"
+            prefix, infix, suffix = f"{mudda_number}_", "_", ".html"
+        
+        # One directory scan with plain string matching instead of glob
+        matches = []
+        with os.scandir(self.html_folder) as entries:
+            for entry in entries:
+                name = entry.name
+                if suffix and name.endswith(".html.gz"):
+                    name = name[:-len(".gz")]
+                if name.startswith(".") or not name.startswith(prefix) or not name.endswith(suffix):
+                    continue
+                if infix and infix not in name[len(prefix):len(name) - len(suffix)]:
+                    continue
+                matches.append(entry.path)
         
-        search_path = os.path.join(self.html_folder, pattern)
-        return glob.glob(search_path)
+        return matches
 
     def extract_info_from_filename(self, filename):
         """Extract mudda_type, sal, and link_number from filename"""
         basename = os.path.basename(filename)
-        match = re.match(r'(\d+)_(\d+)_(\d+)\.html', basename)
+        match = _FNAME_RE.fullmatch(basename)
         
         if match:
             mudda_number, sal, link_number = match.groups()
@@ -231,374 +577,241 @@ class LegalCaseScraper:
         return None, None, None
 
     def from_each_page(self, links):
-        """Extract unique case links from page links"""
-        li = []
-        flag = False
-        i = 0
-        while(i < len(links)):
-            href = links[i].get('href')
-            if href and "#" in href:
-                i+=1
-                if i < len(links):
-                    temp_href = links[i].get('href')
-                    if temp_href:
-                        li.append(temp_href)
-            else:
-                i+=1
-        unique_list = []
+        """Extract case links from page links (duplicates are removed by the caller)"""
+        # Each case link is the anchor right after a "#" anchor
+        hrefs = [link.get('href') for link in links]
+        li = [href for prev, href in zip(hrefs, hrefs[1:]) if prev and "#" in prev and href]
         if(len(li) > 1):
-            unique_list = list(dict.fromkeys(li))
-        return unique_list
+            return li
+        return []
     
     def get_all_pages(self, initial_url, mudda_type=None, sal=None, use_saved=True):
         """Get all page URLs for pagination"""
-        soup = self.return_soup(initial_url, mudda_type, sal, use_saved)
+        return list(self.iter_case_links(initial_url, mudda_type, sal, use_saved))
+    
+    def iter_case_links(self, initial_url, mudda_type=None, sal=None, use_saved=True):
+        """Yield the case links of every result page, each once, as the pages come in"""
+        soup = self.return_soup(initial_url, mudda_type, sal, use_saved, parse_only=LINKS_ONLY)
         if not soup:
-            return []
+            return
             
         links = soup.find_all('a')
-        all_links = []
+        has_pager = False
         other_pages = []
         
         for link in links:
             href = link.get('href')
-            if href:
-                all_links.append(href)
-                if "https://nkp.gov.np/advance_search/" in href:
-                    other_pages.append(href)
+            if href == "javascript:void(0)":
+                has_pager = True
+            elif href and "https://nkp.gov.np/advance_search/" in href:
+                other_pages.append(href)
         
-        unique_list = self.from_each_page(links)
+        # Case links already yielded, across every result page
+        seen = set()
+        for href in self.from_each_page(links):
+            if href not in seen:
+                seen.add(href)
+                yield href
         
         # Handle pagination
-        if "javascript:void(0)" in all_links and other_pages:
+        if has_pager and other_pages:
             mx = 0
             for j in other_pages:
-                temp = ""
-                for i in range(len(j)-1, -1, -1):
-                    if j[i] == "=":
-                        break
-                    temp = j[i] + temp
                 try:
-                    temp2 = int(temp)
+                    temp2 = int(j.rpartition("=")[2])
                     if mx < temp2:
                         mx = temp2
                 except ValueError:
                     continue
             if mx > 0:
-                st = other_pages[0][:-2]
+                # Strip the page offset whatever its length ("=20", "=100", ...)
+                st = other_pages[0].rpartition("=")[0] + "="
                 real_other_pages = []
                 for i in range(20, mx + 1, 20):
                     real_other_pages.append(st + str(i))
                 
-                unique_list2 = []
-                for page_url in real_other_pages:
+                def fetch_page(page_url):
                     print(f"Processing page: {page_url}")
                     try:
-                        page_soup = self.return_soup(page_url, mudda_type, sal, use_saved)
-                        if page_soup:
-                            page_links = page_soup.find_all('a')
-                            unique_list2 += self.from_each_page(page_links)
+                        return self.return_soup(page_url, mudda_type, sal, use_saved, parse_only=LINKS_ONLY)
                     except Exception as e:
                         print(f"Error scraping page {page_url}: {e}")
+                        return None
                 
-                unique_list += unique_list2
-        
-        # Remove duplicates
-        unique_unique_list = list(dict.fromkeys(unique_list))
-        return unique_unique_list
+                # Result pages are independent, so fetch them concurrently;
+                # map() still yields them in page order
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    for page_soup in executor.map(fetch_page, real_other_pages):
+                        if page_soup:
+                            page_links = page_soup.find_all('a')
+                            for href in self.from_each_page(page_links):
+                                if href not in seen:
+                                    seen.add(href)
+                                    yield href
     
-    def get_edition_field(self, soup, label):
-        """Extract edition field from soup"""
-        edition_info = soup.find("div", id="edition-info")
+    def find_case_sections(self, soup):
+        """Locate the title, edition, meta and detail blocks of a case page in one pass"""
+        sections = {"title": None, "edition_info": None, "post_meta": None, "detail": None}
+        remaining = len(sections)
+        for node in soup.descendants:
+            name = getattr(node, "name", None)
+            if name == "h1":
+                if sections["title"] is None and "post-title" in node.get("class", ()):
+                    sections["title"] = node
+                    remaining -= 1
+            elif name == "div":
+                div_id = node.get("id")
+                if sections["edition_info"] is None and div_id == "edition-info":
+                    sections["edition_info"] = node
+                    remaining -= 1
+                if sections["detail"] is None and div_id == "faisala_detail ":
+                    sections["detail"] = node
+                    remaining -= 1
+                if sections["post_meta"] is None and "post-meta" in node.get("class", ()):
+                    sections["post_meta"] = node
+                    remaining -= 1
+            else:
+                continue
+            if not remaining:
+                break
+        return sections
+
+    def get_edition_fields(self, edition_info, labels):
+        """Extract several edition fields from the edition-info block in one pass"""
+        # Each label takes the first span whose text contains it, as before
+        fields = dict.fromkeys(labels)
+        remaining = list(labels)
         if edition_info:
             for span in edition_info.find_all("span"):
-                if label in span.text:
+                span_text = span.text
+                matched = [label for label in remaining if label in span_text]
+                if matched:
                     strong = span.find("strong")
-                    return strong.text.strip() if strong else None
-        return None
+                    value = strong.text.strip() if strong else None
+                    for label in matched:
+                        fields[label] = value
+                        remaining.remove(label)
+                    if not remaining:
+                        break
+        return fields
+
+    def determine_era(self, sal):
+        """Determine the publication era (parsing options) of a year"""
+        # A run scrapes one year, so resolve it once rather than per case URL
+        era = self._eras_by_sal.get(sal)
+        if era is not None:
+            return era
+        
+        eng_sal = int(self.nepali_sal_to_english_sal(sal))
+        for era in ERAS:
+            first, last = era["years"]
+            if first <= eng_sal <= last:
+                self._eras_by_sal[sal] = era
+                return era
+        raise ValueError(f"No scraper method available for year {eng_sal}")
 
     def determine_scraper_method(self, sal):
         """Determine which scraper method to use based on year"""
-        eng_sal = int(self.nepali_sal_to_english_sal(sal))
-        
-        if 2015 <= eng_sal <= 2044:
-            return self.scrape_case_details_2015_to_2044
-        elif 2045 <= eng_sal <= 2050:
-            return self.scrape_case_details_2045_to_2050
-        elif 2051 <= eng_sal <= 2061:
-            return self.scrape_case_details_2051_to_2061
-        elif 2062 <= eng_sal <= 2072:
-            return self.scrape_case_details_2062_to_2072
-        elif 2073 <= eng_sal <= 2080:
-            return self.scrape_case_details_2073_to_2080
-        else:
-            raise ValueError(f"No scraper method available for year {eng_sal}")
+        first, last = self.determine_era(sal)["years"]
+        return getattr(self, f"scrape_case_details_{first}_to_{last}")
 
-    def scrape_case_details_generic(self, url, mudda_type, sal, use_saved=True):
+    def scrape_case_details_generic(self, url, mudda_type, sal, use_saved=True, html=None):
         """Generic method that routes to the appropriate scraper based on year"""
         try:
             scraper_method = self.determine_scraper_method(sal)
-            return scraper_method(url, mudda_type, sal, use_saved)
+            return scraper_method(url, mudda_type, sal, use_saved, html)
         except ValueError as e:
             print(f"Error: {e}")
             return False
 
-    # [Previous scraper methods with modifications for HTML file handling]
-    def scrape_case_details_2015_to_2044(self, url, mudda_type, sal=None, use_saved=True):
-        """Scrape details from a single case URL (2015-2044)"""
+    def fetch_case_html(self, url, mudda_type, sal, use_saved, era):
+        """Get a case page's HTML, or None if it is unavailable; safe to call from worker threads"""
+        if era["probe_status"]:
+            r = self.http_get(url, timeout=15)
+            if r.status_code != 200:
+                print(f"Failed to retrieve {url}, Status code: {r.status_code}")
+                return None
+            # The status check already downloaded the page; only a saved copy
+            # takes precedence over it
+            html_content = self.load_saved_html(url, mudda_type, sal, CASE_PAGE_MARKER) if use_saved else None
+            return html_content or self.html_from_response(r, url, mudda_type, sal, CASE_PAGE_MARKER)
+        return self.fetch_html(url, mudda_type, sal, use_saved, marker=CASE_PAGE_MARKER)
+
+    def prefetch_case_html(self, url, mudda_type, sal, use_saved=True):
+        """Fetch a case page ahead of parsing; "" marks a page that could not be fetched"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT लिङ्क FROM cases WHERE लिङ्क = ?', (url,))
-            if cursor.fetchone():
+            era = self.determine_era(sal)
+            if era["skip_known"] and url in self._known_links:
+                return None
+            return self.fetch_case_html(url, mudda_type, sal, use_saved, era) or ""
+        except Exception as e:
+            # Leave it to the scraper, which fetches again and reports the error
+            print(f"Error prefetching {url}: {e}")
+            return None
+
+    def _scrape_case_details(self, url, mudda_type, sal, use_saved, era, extract_header, html=None):
+        """Scrape a single case URL with the parsing options of its publication era"""
+        # html is the page when it was already fetched by the pipeline ("" if
+        # that fetch failed); None means fetch it here
+        try:
+            if era["skip_known"] and url in self._known_links:
                 print(f"URL {url} already exists in database, skipping...")
                 return True
             
             # Get soup using saved HTML or web
-            soup = self.return_soup(url, mudda_type, sal, use_saved)
+            if html is None:
+                html = self.fetch_case_html(url, mudda_type, sal, use_saved, era)
+            
+            # A page identical to the one its stored row was parsed from
+            # would produce the same row again, so skip parsing it
+            page_digest = self.page_digest(html, mudda_type, sal) if html else None
+            if page_digest and url in self._known_links and self._page_digests.get(url) == page_digest:
+                print(f"URL {url} unchanged since it was last scraped, skipping...")
+                return True
+            
+            soup = self.parse_html(html) if html else None
             if not soup:
                 print(f"Failed to get content for {url}")
                 return False
             
             # Extract basic information
-            title_tag = soup.find("h1", class_="post-title")
-            decision_title = title_tag.get_text(strip=True).split()[2] if title_tag and len(title_tag.get_text(strip=True).split()) > 2 else "N/A"
+            sections = self.find_case_sections(soup)
+            title_tag = sections["title"]
+            title_words = title_tag.get_text(strip=True).split() if title_tag else []
+            decision_title = title_words[2] if len(title_words) > 2 else "N/A"
             
-            bhaag = self.get_edition_field(soup, "भाग")
-            saal = self.get_edition_field(soup, "साल")
-            mahina = self.get_edition_field(soup, "महिना")
-            anka = self.get_edition_field(soup, "अंक")
+            edition = self.get_edition_fields(sections["edition_info"], EDITION_LABELS)
+            bhaag, saal, mahina, anka = (edition[label] for label in EDITION_LABELS)
             
             # Extract decision date
-            post_meta = soup.find("div", class_="post-meta")
+            post_meta = sections["post_meta"]
+            meta_text = post_meta.text.strip() if post_meta else ""
             decision_date = "N/A"
-            if post_meta and "फैसला मिति" in post_meta.text:
-                try:
-                    decision_date = post_meta.text.strip().split("फैसला मिति :")[-1].split("\n")[0].strip().split()[0]
-                except IndexError:
-                    decision_date = "N/A"
+            if "फैसला मिति" in meta_text:
+                # First word on the line after the last "फैसला मिति :" label
+                date_words = meta_text.rpartition("फैसला मिति :")[2].partition("\n")[0].split(None, 1)
+                if date_words:
+                    decision_date = date_words[0]
             
             # Extract detailed information
-            div_tag = soup.find("div", id="faisala_detail ")
+            div_tag = sections["detail"]
             details = {}
             
             if div_tag:
-                tags = div_tag.find_all(['h1', 'p'])
-                n = len(tags)
-                ind = 0
-                temp_ind_32 = ind
-                KEYWORDS_2 = ["(प्रकरण नं", "(प्रकारण नं.", "९प्रकरण नं।", "(प्रकरण", "(प्र नं.","( प्र. नं","(प्र.नं", "(प्र. नं", "( प्रकरण नं.", "( प्रकरणन", "( प्र.नं.", "( प्र . नं .", "( प ्र . नं .", "(प्ररकण नं.", "(प्रकराण नं."]
-                KEYWORDS_3 = ["निवेदक", "वादी", "पुनरावेदक", "निबेदक", "पुनरावदेक", "निवेदिका", "निवेदीका", "निवदेक", "न ि वेदक ः", "नि वेदक ः", "पुनरावेदन", "पुनरवेदिका", "पुनरावेदिका", "पुनरावेदीका", "बादि", "पुनराबेदक", "प्रतिबादी", "पुनरावेक", "अपीलाट", "निवेदनक", "उजुरवाला", "अपिलबाट", "अपिलाट"]
-                KEYWORDS_4 = ["विपक्षी", "प्रतिवादी", "प्रत्यर्थी", "बिपक्षी", "विपक्षी ः", "पिपक्षी", "विरुद्ध", "प्रत्यार्थी", "विरूद्ध", "बिरूद्ध", "विपक्ष", "रेस्पोण्डेण्ट", "रेस्पोन्डेन्ट"]
-                KEYWORDS_5 = ["विषय", "मुद्दा", "बिषय", "मूद्दा", "मुद्द", "मद्दा", "विपक्ष", "मुद्धा"]
-                KEYWORDS_6 = ["इजलास", "इजालास", "इजलाश", "बेञ्च"]
-                KEYWORDS_7 = ["आदेश", "फैसला", "फैसलमा", "निर्णय", "फै सला"]
-                KEYWORDS_8 = ["न्यायाधीश", "माननीय", "न्यायधीश", "न्यायाधीस", "न्ययाधीश", "न्यायाधिश", "न्यायाधी", "न्यानायधीश", "नयायाधीश", "न्यायाधधिश", "नयाधश"]
-                
-                # Extract court information
-                temp_ijlash = ""
-                while(ind < n):
-                    text = tags[ind].get_text(separator=' ', strip=True)
-                    if text:
-                        if any(kw == text for kw in KEYWORDS_6):
-                            if "निर्णय नं." not in temp_ijlash:
-                                details["इजलास"] = temp_ijlash
-                            ind+=1
-                            break
-                        elif any(kw in text for kw in KEYWORDS_6):
-                            details["इजलास"] = text
-                            ind+=1
-                            text_2 = tags[ind].get_text(separator=' ', strip=True)
-                            if any(kw in text_2 for kw in KEYWORDS_8) == False:
-                                details["इजलास"] = text +" "+ text_2
-                                ind+=1
-                            break
-                        elif any(kw in text for kw in KEYWORDS_8):
-                            if "निर्णय नं." not in temp_ijlash:
-                                details["इजलास"] = temp_ijlash
-                            break
-                        temp_ijlash = text
-                    ind+=1
-
-                if ind >= n:
-                    ind = temp_ind_32
-                else:
-                    temp_ind_32 = ind
-                
-                # Extract judges
-                judges = []
-                while ind < n:
-                    text = tags[ind].get_text(separator=' ', strip=True)
-                    if text:
-                        if any(kw in text for kw in KEYWORDS_8):
-                            judges.append(text)
-                        else:
-                            details["न्यायाधीश"] = judges
-                            if any(kw2 in text for kw2 in KEYWORDS_3) == False and any(kw2 in text for kw2 in KEYWORDS_5) == False:
-                                details["केस_नम्बर"] = text
-                                ind+=1
-                            break
-                    ind += 1
-
-                if ind >= n:
-                    ind = temp_ind_32
-                else:
-                    temp_ind_32 = ind
-                
-                # Standard case structure      
-                bisaya_before_niweduck = False
-                temp_ind_64 = ind
-
-                while temp_ind_64 < n:
-                    text = tags[temp_ind_64].get_text(separator=' ', strip=True)
-                    if any(kw in text for kw in KEYWORDS_3) or any(kw in text for kw in KEYWORDS_4):
-                        break
-                    if any(kw in text for kw in KEYWORDS_5):
-                        bisaya_before_niweduck = True
-                        break
-                    temp_ind_64+=1
-                
-                if bisaya_before_niweduck:    
-                    while ind < n:
-                        text = tags[ind].get_text(separator=' ', strip=True)
-                        if any(text.startswith(kw) for kw in KEYWORDS_5):
-                            details["विषय"] = text
-                            ind+=1
-                            break
-                        if any(kw in text for kw in KEYWORDS_3):
-                            ind = temp_ind_32
-                            break
-                        ind+=1
-                else:
-                    while ind  < n:
-                        text = tags[ind].get_text(separator=' ', strip=True)
-                        if any(text.startswith(kw) for kw in KEYWORDS_7) and ("मिति" in text or "मिती" in text):
-                            details["आदेश मिति"] = text
-                            ind+=1
-                            break
-                        if any(kw in text for kw in KEYWORDS_3):
-                            ind = temp_ind_32
-                            break
-                        ind+=1
-                
-                if ind >= n:
-                    ind = temp_ind_32
-                else:
-                    temp_ind_32 = ind
-                        
-                while ind < n:
-                    text = tags[ind].get_text(separator=' ', strip=True)
-                    if any(kw in text for kw in KEYWORDS_3):
-                        if any(kw2 == text for kw2 in KEYWORDS_3):
-                            ind += 1
-                            text = tags[ind].get_text(separator=' ', strip=True)
-                        details["निवेदक"] = text
-                        ind+=1
-                        break
-                    ind+=1
-
-                if ind >= n:
-                    ind = temp_ind_32
-                else:
-                    temp_ind_32 = ind
-
-                while ind < n:
-                    text = tags[ind].get_text(separator=' ', strip=True)
-                    if any(kw in text for kw in KEYWORDS_4):
-                        if any(kw2 == text for kw2 in KEYWORDS_4):
-                            ind += 1
-                            text = tags[ind].get_text(separator=' ', strip=True)
-                        details["विपक्षी"] = text
-                        ind+=1
-                        break
-                    ind+=1
-                    
-                if ind >= n:
-                    ind = temp_ind_32
-                else:
-                    temp_ind_32 = ind
-
-                if bisaya_before_niweduck==False:    
-                    while ind < n:
-                        text = tags[ind].get_text(separator=' ', strip=True)
-                        if any(text.startswith(kw) for kw in KEYWORDS_5):
-                            details["विषय"] = text
-                            ind+=1
-                            break
-                        if any(kw in text for kw in KEYWORDS_2):
-                            ind = temp_ind_32
-                            break
-                        ind+=1
-                else:
-                    while ind  < n:
-                        text = tags[ind].get_text(separator=' ', strip=True)
-                        if any(text.startswith(kw) for kw in KEYWORDS_7) and ("मिति" in text or "मिती" in text):
-                            details["आदेश मिति"] = text
-                            ind+=1
-                            break
-                        if any(kw in text for kw in KEYWORDS_2):
-                            ind = temp_ind_32
-                            break
-                        ind+=1
-
-                if ind >= n:
-                    ind = temp_ind_32
-                else:
-                    temp_ind_32 = ind
-                
-                # Extract prakarans and tahar
-                prakarans = []
-                prev = ""
-                tahar = []
-                temp_flag_tahar = False
-
-                for tag in tags[ind:]:
-                    text = tag.get_text(separator=' ', strip=True)
-                    if text:
-                        if "§" in text or any(kw in text for kw in KEYWORDS_2) or "फैसला"==text or "आदेश"==text or "फैसलाः"==text:
-                            if any(kw in text for kw in KEYWORDS_2):
-                                if prev:
-                                    prakarans.append(prev)
-                                prakarans.append(text)
-                                prev = ""
-                            if "§" in text:
-                                prakarans.append(text)
-                            if "फैसला"==text or "आदेश"==text or "फैसलाः"==text:
-                                if not prakarans:
-                                    prakarans.append(prev)
-                        else:
-                            prev = prev + " " + text if prev else text
-                        
-                        if text in ["फैसला", "आदेश", "फैसलाः"] or temp_flag_tahar:
-                            temp_flag_tahar = True
-                            tahar.append(text)
-
-                    # Process list items
-                    next_sib = tag.find_next_sibling()
-                    while next_sib and next_sib.name in ['ul', 'ol']:
-                        for li in next_sib.find_all('li'):
-                            li_text = li.get_text(separator=' ', strip=True)
-                            if li_text:
-                                if any(kw in li_text for kw in KEYWORDS_2):
-                                    if prev:
-                                        prakarans.append(prev)
-                                    prakarans.append(li_text)
-                                    prev = ""
-                                else:
-                                    prev = prev + " " + li_text if prev else li_text
-                                if li_text in ["फैसला", "आदेश", "फैसलाः"] or temp_flag_tahar:
-                                    temp_flag_tahar = True
-                                    tahar.append(li_text)
-                        next_sib = next_sib.find_next_sibling()                
+                tags = div_tag.find_all(era["detail_tags"])
+                # Text of each paragraph, extracted once and shared by every pass
+                texts = [tag_text(tag, era["text_separator"]) for tag in tags]
+                ind = extract_header(texts, details)
+                prakarans, tahar = self._extract_prakarans(tags[ind:], texts[ind:], era)
                 details["प्रकरण"] = prakarans
                 details["ठहर"] = tahar
             
             # Get HTML file path
             html_file_path = ""
             if mudda_type and sal:
-                filename = self.generate_html_filename(url, mudda_type, sal)
-                html_file_path = os.path.join(self.html_folder, filename)
+                html_file_path = self.html_file_path(url, mudda_type, sal)
             
-            # Combine all data
+            # Combine all data, handling lists and strings appropriately
             data = {
                 "लिङ्क": url,
                 "निर्णय नं.": decision_title,
@@ -609,19 +822,19 @@ class LegalCaseScraper:
                 "अंक": anka or "N/A",
                 "फैसला मिति": f"'{decision_date}'",
                 "अदालत / इजलास": details.get("इजलास", "N/A"),
-                "न्यायाधीश": json.dumps(details.get("न्यायाधीश", []), ensure_ascii=False),
+                "न्यायाधीश": JSON_ENCODER.encode(details.get("न्यायाधीश", [])),
                 "आदेश मिति": details.get("आदेश मिति", "N/A"),
-                "केस_नम्बर": json.dumps(details.get("केस_नम्बर", []), ensure_ascii=False) if isinstance(details.get("केस_नम्बर"), list) else details.get("केस_नम्बर", "N/A"),
+                "केस_नम्बर": JSON_ENCODER.encode(details.get("केस_नम्बर", [])) if isinstance(details.get("केस_नम्बर"), list) else details.get("केस_नम्बर", "N/A"),
                 "विषय": details.get("विषय", "N/A"),
-                "निवेदक": json.dumps(details.get("निवेदक", []), ensure_ascii=False) if isinstance(details.get("निवेदक"), list) else details.get("निवेदक", "N/A"),
-                "विपक्षी": json.dumps(details.get("विपक्षी", []), ensure_ascii=False) if isinstance(details.get("विपक्षी"), list) else details.get("विपक्षी", "N/A"),
-                "प्रकरण": json.dumps(details.get("प्रकरण", []), ensure_ascii=False),
-                "ठहर": json.dumps(details.get("ठहर", []), ensure_ascii=False),
+                "निवेदक": JSON_ENCODER.encode(details.get("निवेदक", [])) if isinstance(details.get("निवेदक"), list) else details.get("निवेदक", "N/A"),
+                "विपक्षी": JSON_ENCODER.encode(details.get("विपक्षी", [])) if isinstance(details.get("विपक्षी"), list) else details.get("विपक्षी", "N/A"),
+                "प्रकरण": JSON_ENCODER.encode(details.get("प्रकरण", [])),
+                "ठहर": JSON_ENCODER.encode(details.get("ठहर", [])),
                 "html_file_path": html_file_path
             }
             
             # Save to SQLite
-            self.save_to_sqlite(data)
+            self.save_to_sqlite(data, page_digest)
             print(f"{url} - Successfully Scraped and Entered")
             return True
             
@@ -629,583 +842,585 @@ class LegalCaseScraper:
             print(f"Error scraping {url}: {e}")
             return False
 
-#def scrape_case_details_2015_to_2044(self, url, mudda_type, sal=None, use_saved=True):
-    def scrape_case_details_2045_to_2050(self, url, mudda_type, sal = None, use_saved=True):  # CHANGE 4: Remove output_db parameter
-        """Scrape details from a single case URL"""
-        try:
-            # IMPROVEMENT 16: Check if URL already exists in database
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT लिङ्क FROM cases WHERE लिङ्क = ?', (url,))
-            if cursor.fetchone():
-                print(f"URL {url} already exists in database, skipping...")
-                return True
-
-            # Get soup using saved HTML or web
-            soup = self.return_soup(url, mudda_type, sal, use_saved)
-            if not soup:
-                print(f"Failed to get content for {url}")
-                return False
-            
-            # Extract basic information
-            title_tag = soup.find("h1", class_="post-title")
-            decision_title = title_tag.get_text(strip=True).split()[2] if title_tag and len(title_tag.get_text(strip=True).split()) > 2 else "N/A"  # IMPROVEMENT 19: Bounds checking
-            
-            bhaag = self.get_edition_field(soup, "भाग")
-            saal = self.get_edition_field(soup, "साल")
-            mahina = self.get_edition_field(soup, "महिना")
-            anka = self.get_edition_field(soup, "अंक")
-            
-            # Extract decision date
-            post_meta = soup.find("div", class_="post-meta")
-            decision_date = "N/A"
-            if post_meta and "फैसला मिति" in post_meta.text:
-                try:  # IMPROVEMENT 20: Better error handling for date extraction
-                    decision_date = post_meta.text.strip().split("फैसला मिति :")[-1].split("\n")[0].strip().split()[0]
-                except IndexError:
-                    decision_date = "N/A"
-            
-            # Extract detailed information
-            div_tag = soup.find("div", id="faisala_detail ")
-            details = {}
-            
-            if div_tag:
-                tags = div_tag.find_all(['h1', 'p'])
-                n = len(tags)
-                ind = 0
-                temp_ind_32 = ind
-                KEYWORDS_2 = ["(प्ररकण नं.", "(प्रकरण नं", "(प्रकारण नं.", "९प्रकरण नं।", "(प्रकरण", "( प्र. नं","(प्र.नं", "(प्र. नं", "( प्रकरण नं.", "( प्रकरणन", "( प्र.नं.", "( प्र . नं .", "( प ्र . नं ."]
-                KEYWORDS_3 = ["निवेदक", "वादी", "पुनरावेदक", "निबेदक", "पुनरावदेक", "निवेदिका", "निवदेक", "न ि वेदक ः", "नि वेदक ः", "पुनरावेदन", "पुनरवेदिका", "बादि", "पुनराबेदक", "प्रतिबादी"]
-                KEYWORDS_4 = ["विपक्षी", "प्रतिवादी", "प्रत्यर्थी", "बिपक्षी", "विपक्षी ः", "पिपक्षी", "विरुद्ध", "प्रत्यार्थी"]
-                KEYWORDS_5 = ["विषय", "मुद्दा", "बिषय", "मूद्दा"]
-                KEYWORDS_6 = ["इजलास", "इजालास", "इजलाश"]
-                KEYWORDS_7 = ["आदेश", "फैसला", "फैसलमा", "निर्णय"]
-                
-                # Extract court information
-                temp_ijlash = ""
-                while(ind < n):
-                    #text = p_tags[ind].get_text(strip=True)
-                    text = tags[ind].get_text(separator=' ', strip=True)
-                    if text:
-                        if any(kw == text for kw in KEYWORDS_6):
-                            details["इजलास"] = temp_ijlash
-                            ind+=1
-                            break
-                        elif any(kw in text for kw in KEYWORDS_6):
-                            details["इजलास"] = text
-                            ind+=1
-                            break
-                        elif "न्यायाधीश" in text or "माननीय" in text:
-                            details["इजलास"] = temp_ijlash
-                            break
-                        temp_ijlash = text
-                    ind+=1
-
-                if ind >= n:
-                    ind = temp_ind_32
+    def _extract_prakarans(self, tags, texts, era):
+        """Split the judgment body into prakarans and collect the tahar (verdict) section"""
+        keywords = era["keywords"]
+        is_prakaran = keywords[2].starts if era["prakaran_at_start"] else keywords[2].occurs_in
+        verdict_markers = era["verdict_markers"]
+        separator = era["text_separator"]
+        split_on_section_mark = era["split_on_section_mark"]
+        split_on_verdict = era["split_on_verdict"]
+        keep_empty_prev = era["keep_empty_prev"]
+        prakarans = []
+        # Paragraphs of the prakaran being read, joined once at its boundary
+        prev_parts = []
+        tahar = []
+        # Bound once; these run for every paragraph and list item of the judgment
+        add_prakaran = prakarans.append
+        add_tahar = tahar.append
+        temp_flag_tahar = False
+
+        for tag, text in zip(tags, texts):
+            if text:
+                if is_prakaran(text):
+                    if prev_parts or keep_empty_prev:
+                        add_prakaran(" ".join(prev_parts))
+                    add_prakaran(text)
+                    prev_parts = []
+                elif split_on_section_mark and "§" in text:
+                    add_prakaran(text)
+                elif split_on_verdict and text in verdict_markers:
+                    if not prakarans:
+                        add_prakaran(" ".join(prev_parts))
                 else:
-                    temp_ind_32 = ind
+                    prev_parts.append(text)
                 
-                # Extract judges
-                judges = []
-                while ind < n:
-                    text = tags[ind].get_text(separator=' ', strip=True)
-                    if text:
-                        if "न्यायाधीश" in text or "माननीय" in text:
-                            judges.append(text)
-                        elif any(kw in text for kw in KEYWORDS_7) and "मिति" in text:
-                            details["न्यायाधीश"] = judges
-                            details["आदेश मिति"] = text
-                            ind += 1
-                            break
+                if text in verdict_markers or temp_flag_tahar:
+                    temp_flag_tahar = True
+                    add_tahar(text)
+
+            # Process list items
+            next_sib = next_tag_sibling(tag)
+            while next_sib and next_sib.name in ('ul', 'ol'):
+                # Walk the list's subtree directly rather than collecting find_all('li')
+                for li in next_sib.descendants:
+                    if not isinstance(li, Tag) or li.name != 'li':
+                        continue
+                    li_text = tag_text(li, separator)
+                    if li_text:
+                        if is_prakaran(li_text):
+                            if prev_parts or keep_empty_prev:
+                                add_prakaran(" ".join(prev_parts))
+                            add_prakaran(li_text)
+                            prev_parts = []
                         else:
-                            details["केस_नम्बर"] = text
-                    ind += 1
+                            prev_parts.append(li_text)
+                        if li_text in verdict_markers or temp_flag_tahar:
+                            temp_flag_tahar = True
+                            add_tahar(li_text)
+                next_sib = next_tag_sibling(next_sib)
+        
+        return prakarans, tahar
 
-                if ind >= n:
-                    ind = temp_ind_32
+    def scrape_case_details_2015_to_2044(self, url, mudda_type, sal=None, use_saved=True, html=None):
+        """Scrape details from a single case URL (2015-2044)"""
+        return self._scrape_case_details(url, mudda_type, sal, use_saved, ERA_2015_TO_2044, self._extract_header_2015_to_2044, html)
+
+    def _extract_header_2015_to_2044(self, texts, details):
+        """Read court, judges, dates and parties (2015-2044 layout); return where prakarans start"""
+        n = len(texts)
+        ind = 0
+        temp_ind_32 = ind
+        keywords = KEYWORDS_2015_TO_2044
+
+        # Extract court information
+        temp_ijlash = ""
+        while(ind < n):
+            text = texts[ind]
+            if text:
+                if keywords[6].equals(text):
+                    if "निर्णय नं." not in temp_ijlash:
+                        details["इजलास"] = temp_ijlash
+                    ind+=1
+                    break
+                elif keywords[6].occurs_in(text):
+                    details["इजलास"] = text
+                    ind+=1
+                    text_2 = texts[ind]
+                    if not keywords[8].occurs_in(text_2):
+                        details["इजलास"] = text +" "+ text_2
+                        ind+=1
+                    break
+                elif keywords[8].occurs_in(text):
+                    if "निर्णय नं." not in temp_ijlash:
+                        details["इजलास"] = temp_ijlash
+                    break
+                temp_ijlash = text
+            ind+=1
+
+        if ind >= n:
+            ind = temp_ind_32
+        else:
+            temp_ind_32 = ind
+
+        # Extract judges
+        judges = []
+        while ind < n:
+            text = texts[ind]
+            if text:
+                if keywords[8].occurs_in(text):
+                    judges.append(text)
                 else:
-                    temp_ind_32 = ind
-                
-                # Standard case structure    
-                bisaya_before_niweduck = False
-                details["विषय"] = ""
+                    details["न्यायाधीश"] = judges
+                    if not keywords[3].occurs_in(text) and not keywords[5].occurs_in(text):
+                        details["केस_नम्बर"] = text
+                        ind+=1
+                    break
+            ind += 1
 
-                while ind < n:
-                    text = tags[ind].get_text(separator=' ', strip=True)
-                    if any(kw in text for kw in KEYWORDS_3) or any(kw in text for kw in KEYWORDS_4):
-                        break
-                    if any(kw in text for kw in KEYWORDS_5):
-                        bisaya_before_niweduck = True
-                        break
+        if ind >= n:
+            ind = temp_ind_32
+        else:
+            temp_ind_32 = ind
+
+        # Standard case structure      
+        bisaya_before_niweduck = False
+        temp_ind_64 = ind
+
+        while temp_ind_64 < n:
+            text = texts[temp_ind_64]
+            if keywords[3].occurs_in(text) or keywords[4].occurs_in(text):
+                break
+            if keywords[5].occurs_in(text):
+                bisaya_before_niweduck = True
+                break
+            temp_ind_64+=1
+
+        if bisaya_before_niweduck:    
+            while ind < n:
+                text = texts[ind]
+                if keywords[5].starts(text):
+                    details["विषय"] = text
                     ind+=1
-
-                if ind >= n:
+                    break
+                if keywords[3].occurs_in(text):
                     ind = temp_ind_32
-                else:
-                    temp_ind_32 = ind
-
-                if bisaya_before_niweduck:    
-                    while ind < n:
-                        #text = p_tags[ind].get_text(strip=True)
-                        text = tags[ind].get_text(separator=' ', strip=True)
-                        if any(kw in text for kw in KEYWORDS_5):
-                            details["विषय"] = text
-                            ind+=1
-                            break
-                        ind+=1
-                
-                    if ind >= n:
-                        ind = temp_ind_32
-                    else:
-                        temp_ind_32 = ind
-                        
-                    #temp_Ind = ind
-                while ind < n:
-                        #text = p_tags[ind].get_text(strip=True)
-                    text = tags[ind].get_text(separator=' ', strip=True)
-                    if any(kw in text for kw in KEYWORDS_3):
-                        if any(kw2 == text for kw2 in KEYWORDS_3):
-                            ind += 1
-                            text = tags[ind].get_text(separator=' ', strip=True)
-                        details["निवेदक"] = text
-                        ind+=1
-                        break
+                    break
+                ind+=1
+        else:
+            while ind  < n:
+                text = texts[ind]
+                if keywords[7].starts(text) and ("मिति" in text or "मिती" in text):
+                    details["आदेश मिति"] = text
                     ind+=1
-
-                if ind >= n:
+                    break
+                if keywords[3].occurs_in(text):
                     ind = temp_ind_32
-                else:
-                    temp_ind_32 = ind
+                    break
+                ind+=1
 
-                while ind < n:
-                        #text = p_tags[ind].get_text(strip=True)
-                    text = tags[ind].get_text(separator=' ', strip=True)
-                    if any(kw in text for kw in KEYWORDS_4):
-                        if any(kw2 == text for kw2 in KEYWORDS_4):
-                            ind += 1
-                            text = tags[ind].get_text(separator=' ', strip=True)
-                        details["विपक्षी"] = text
-                        ind+=1
-                        break
+        if ind >= n:
+            ind = temp_ind_32
+        else:
+            temp_ind_32 = ind
+
+        while ind < n:
+            text = texts[ind]
+            if keywords[3].occurs_in(text):
+                if keywords[3].equals(text):
+                    ind += 1
+                    text = texts[ind]
+                details["निवेदक"] = text
+                ind+=1
+                break
+            ind+=1
+
+        if ind >= n:
+            ind = temp_ind_32
+        else:
+            temp_ind_32 = ind
+
+        while ind < n:
+            text = texts[ind]
+            if keywords[4].occurs_in(text):
+                if keywords[4].equals(text):
+                    ind += 1
+                    text = texts[ind]
+                details["विपक्षी"] = text
+                ind+=1
+                break
+            ind+=1
+
+        if ind >= n:
+            ind = temp_ind_32
+        else:
+            temp_ind_32 = ind
+
+        if bisaya_before_niweduck==False:    
+            while ind < n:
+                text = texts[ind]
+                if keywords[5].starts(text):
+                    details["विषय"] = text
                     ind+=1
-                    
-                if ind >= n:
+                    break
+                if keywords[2].occurs_in(text):
+                    ind = temp_ind_32
+                    break
+                ind+=1
+        else:
+            while ind  < n:
+                text = texts[ind]
+                if keywords[7].starts(text) and ("मिति" in text or "मिती" in text):
+                    details["आदेश मिति"] = text
+                    ind+=1
+                    break
+                if keywords[2].occurs_in(text):
                     ind = temp_ind_32
+                    break
+                ind+=1
+
+        if ind >= n:
+            ind = temp_ind_32
+        else:
+            temp_ind_32 = ind
+
+        return ind
+
+    def scrape_case_details_2045_to_2050(self, url, mudda_type, sal=None, use_saved=True, html=None):
+        """Scrape details from a single case URL (2045-2050)"""
+        return self._scrape_case_details(url, mudda_type, sal, use_saved, ERA_2045_TO_2050, self._extract_header_2045_to_2050, html)
+
+    def _extract_header_2045_to_2050(self, texts, details):
+        """Read court, judges, dates and parties (2045-2050 layout); return where prakarans start"""
+        n = len(texts)
+        ind = 0
+        temp_ind_32 = ind
+        keywords = KEYWORDS_2045_TO_2050
+
+        # Extract court information
+        temp_ijlash = ""
+        while(ind < n):
+            text = texts[ind]
+            if text:
+                if keywords[6].equals(text):
+                    details["इजलास"] = temp_ijlash
+                    ind+=1
+                    break
+                elif keywords[6].occurs_in(text):
+                    details["इजलास"] = text
+                    ind+=1
+                    break
+                elif keywords[8].occurs_in(text):
+                    details["इजलास"] = temp_ijlash
+                    break
+                temp_ijlash = text
+            ind+=1
+
+        if ind >= n:
+            ind = temp_ind_32
+        else:
+            temp_ind_32 = ind
+
+        # Extract judges
+        judges = []
+        while ind < n:
+            text = texts[ind]
+            if text:
+                if keywords[8].occurs_in(text):
+                    judges.append(text)
+                elif keywords[7].occurs_in(text) and "मिति" in text:
+                    details["न्यायाधीश"] = judges
+                    details["आदेश मिति"] = text
+                    ind += 1
+                    break
                 else:
-                    temp_ind_32 = ind
+                    details["केस_नम्बर"] = text
+            ind += 1
 
-                if bisaya_before_niweduck==False:    
-                    while ind < n:
-                        #text = p_tags[ind].get_text(strip=True)
-                        text = tags[ind].get_text(separator=' ', strip=True)
-                        if any(kw in text for kw in KEYWORDS_5):
-                            details["विषय"] = text
-                            ind+=1
-                            break
-                        ind+=1
-                
-                    if ind >= n:
-                        ind = temp_ind_32
-                    else:
-                        temp_ind_32 = ind
-                
-                # Extract prakarans and tahar
-                prakarans = []
-                prev = ""
+        if ind >= n:
+            ind = temp_ind_32
+        else:
+            temp_ind_32 = ind
+
+        # Standard case structure    
+        bisaya_before_niweduck = False
+        details["विषय"] = ""
+
+        while ind < n:
+            text = texts[ind]
+            if keywords[3].occurs_in(text) or keywords[4].occurs_in(text):
+                break
+            if keywords[5].occurs_in(text):
+                bisaya_before_niweduck = True
+                break
+            ind+=1
+
+        if ind >= n:
+            ind = temp_ind_32
+        else:
+            temp_ind_32 = ind
 
+        if bisaya_before_niweduck:    
+            while ind < n:
+                text = texts[ind]
+                if keywords[5].occurs_in(text):
+                    details["विषय"] = text
+                    ind+=1
+                    break
+                ind+=1
 
-                tahar = []
-                temp_flag_tahar = False
+            if ind >= n:
+                ind = temp_ind_32
+            else:
+                temp_ind_32 = ind
 
-                for tag in tags[ind:]:
-                    text = tag.get_text(separator=' ', strip=True)
-                    if text:
-                        #if "§" in text or any(kw in text for kw in KEYWORDS_2):
-                            #prakarans.append(text)
-                        if "§" in text or any(kw in text for kw in KEYWORDS_2):
-                            if any(kw in text for kw in KEYWORDS_2):
-                                if prev:  # IMPROVEMENT 23: Only append if prev has content
-                                    prakarans.append(prev)
-                                prev = ""
-                            prakarans.append(text)
-                        else:
-                            prev = prev + " " + text if prev else text
-                        
-                        if text in ["फैसला", "आदेश", "फैसलाः"] or temp_flag_tahar:
-                            temp_flag_tahar = True
-                            tahar.append(text)
-
-                    # Process list items
-                    next_sib = tag.find_next_sibling()
-                    while next_sib and next_sib.name in ['ul', 'ol']:
-                        for li in next_sib.find_all('li'):
-                            li_text = li.get_text(separator=' ', strip=True)
-                            if li_text:
-                                if any(kw in li_text for kw in KEYWORDS_2):
-                                    if prev:  # IMPROVEMENT 24: Only append if prev has content
-                                        prakarans.append(prev)
-                                    prakarans.append(li_text)
-                                    prev = ""
-                                else:
-                                    prev = prev + " " + li_text if prev else li_text
-                                if li_text in ["फैसला", "आदेश", "फैसलाः"] or temp_flag_tahar:
-                                    temp_flag_tahar = True
-                                    tahar.append(li_text)
-                        next_sib = next_sib.find_next_sibling()
-                
-                details["प्रकरण"] = prakarans
-                details["ठहर"] = tahar
+        while ind < n:
+            text = texts[ind]
+            if keywords[3].occurs_in(text):
+                if keywords[3].equals(text):
+                    ind += 1
+                    text = texts[ind]
+                details["निवेदक"] = text
+                ind+=1
+                break
+            ind+=1
+
+        if ind >= n:
+            ind = temp_ind_32
+        else:
+            temp_ind_32 = ind
 
-            # Get HTML file path
-            html_file_path = ""
-            if mudda_type and sal:
-                filename = self.generate_html_filename(url, mudda_type, sal)
-                html_file_path = os.path.join(self.html_folder, filename)
-            
-            # Combine all data, handling lists and strings appropriately
-            data = {
-                "लिङ्क": url,
-                "निर्णय नं.": decision_title,
-                "भाग": bhaag or "N/A",  # IMPROVEMENT 25: Handle None values
-                "मुद्दाको किसिम": mudda_type,
-                "साल": saal or "N/A",
-                "महिना": mahina or "N/A",
-                "अंक": anka or "N/A",
-                "फैसला मिति": f"'{decision_date}'",
-                "अदालत / इजलास": details.get("इजलास", "N/A"),
-                "न्यायाधीश": json.dumps(details.get("न्यायाधीश", []), ensure_ascii=False),
-                "आदेश मिति": details.get("आदेश मिति", "N/A"),
-                "केस_नम्बर": json.dumps(details.get("केस_नम्बर", []), ensure_ascii=False) if isinstance(details.get("केस_नम्बर"), list) else details.get("केस_नम्बर", "N/A"),
-                "विषय": details.get("विषय", "N/A"),
-                "निवेदक": json.dumps(details.get("निवेदक", []), ensure_ascii=False) if isinstance(details.get("निवेदक"), list) else details.get("निवेदक", "N/A"),
-                "विपक्षी": json.dumps(details.get("विपक्षी", []), ensure_ascii=False) if isinstance(details.get("विपक्षी"), list) else details.get("विपक्षी", "N/A"),
-                "प्रकरण": json.dumps(details.get("प्रकरण", []), ensure_ascii=False),
-                "ठहर": json.dumps(details.get("ठहर", []), ensure_ascii=False),
-                "html_file_path": html_file_path
-            }
-            
-            # Save to SQLite
-            self.save_to_sqlite(data)
-            print(f"{url} - Successfully Scraped and Entered")
-            return True
-            
-        except Exception as e:
-            print(f"Error scraping {url}: {e}")
-            return False
+        while ind < n:
+            text = texts[ind]
+            if keywords[4].occurs_in(text):
+                if keywords[4].equals(text):
+                    ind += 1
+                    text = texts[ind]
+                details["विपक्षी"] = text
+                ind+=1
+                break
+            ind+=1
+
+        if ind >= n:
+            ind = temp_ind_32
+        else:
+            temp_ind_32 = ind
 
-    def scrape_case_details_2051_to_2061(self, url, mudda_type, sal = None, use_saved=True):  # CHANGE 4: Remove output_db parameter
-        """Scrape details from a single case URL"""
-        try:
-            # IMPROVEMENT 16: Check if URL already exists in database
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT लिङ्क FROM cases WHERE लिङ्क = ?', (url,))
-            if cursor.fetchone():
-                print(f"URL {url} already exists in database, skipping...")
-                return True
+        if bisaya_before_niweduck==False:    
+            while ind < n:
+                text = texts[ind]
+                if keywords[5].occurs_in(text):
+                    details["विषय"] = text
+                    ind+=1
+                    break
+                ind+=1
 
-            # Get soup using saved HTML or web
-            soup = self.return_soup(url, mudda_type, sal, use_saved)
-            if not soup:
-                print(f"Failed to get content for {url}")
-                return False
-            
-            # Extract basic information
-            title_tag = soup.find("h1", class_="post-title")
-            decision_title = title_tag.get_text(strip=True).split()[2] if title_tag and len(title_tag.get_text(strip=True).split()) > 2 else "N/A"  # IMPROVEMENT 19: Bounds checking
-            
-            bhaag = self.get_edition_field(soup, "भाग")
-            saal = self.get_edition_field(soup, "साल")
-            mahina = self.get_edition_field(soup, "महिना")
-            anka = self.get_edition_field(soup, "अंक")
-            
-            # Extract decision date
-            post_meta = soup.find("div", class_="post-meta")
-            decision_date = "N/A"
-            if post_meta and "फैसला मिति" in post_meta.text:
-                try:  # IMPROVEMENT 20: Better error handling for date extraction
-                    decision_date = post_meta.text.strip().split("फैसला मिति :")[-1].split("\n")[0].strip().split()[0]
-                except IndexError:
-                    decision_date = "N/A"
-            
-            # Extract detailed information
-            div_tag = soup.find("div", id="faisala_detail ")
-            details = {}
-            
-            if div_tag:
-                tags = div_tag.find_all(['h1', 'p'])
-                n = len(tags)
-                ind = 0
+            if ind >= n:
+                ind = temp_ind_32
+            else:
                 temp_ind_32 = ind
-                KEYWORDS_2 = ["(प्रकरण नं", "(प्रकारण नं.", "९प्रकरण नं।", "(प्रकरण", "( प्र. नं","(प्र.नं", "( प्रकरण नं.", "( प्रकरणन", "( प्र.नं.", "( प्र. नं.", "( प्र . नं .", "( प ्र . नं ."]
-                KEYWORDS_3 = ["निवेदक", "वादी", "पुनरावेदक", "निबेदक", "पुनरावदेक", "निवेदिका", "निवदेक", "न ि वेदक ः", "नि वेदक ः", "पुनरावेदन", "पुनरवेदिका", "बादि"]
-                KEYWORDS_4 = ["विपक्षी", "प्रतिवादी", "प्रत्यर्थी", "बिपक्षी", "विपक्षी ः", "पिपक्षी"]
-                
-                # Extract court information
-                while ind < n:
-                    text = tags[ind].get_text(separator=' ', strip=True)
-                    if text and ("इजलास" in text or "इजालास" in text):
-                        details["इजलास"] = text
-                        ind += 1
-                        break
-                    ind += 1
 
+        return ind
+
+    def scrape_case_details_2051_to_2061(self, url, mudda_type, sal=None, use_saved=True, html=None):
+        """Scrape details from a single case URL (2051-2061)"""
+        return self._scrape_case_details(url, mudda_type, sal, use_saved, ERA_2051_TO_2061, self._extract_header_2051_to_2061, html)
+
+    def _extract_header_2051_to_2061(self, texts, details):
+        """Read court, judges, dates and parties (2051-2061 layout); return where prakarans start"""
+        n = len(texts)
+        keywords = KEYWORDS_2051_TO_2061
+
+        # One loop walks the paragraphs through the header fields in order.
+        # A phase ends when its field is found or the text runs out; whenever
+        # that leaves ind past the end, the next phase rescans from the top.
+        COURT, JUDGES, SUBJECT, APPELLANT, OPPONENT, DONE = range(6)
+        phase = COURT
+        ind = 0
+        judges = []
+        while phase != DONE:
+            if ind >= n:
+                ind = 0
+                phase += 1
+                continue
+
+            text = texts[ind]
+            found = False
+            if phase == COURT:
+                if text and keywords[6].occurs_in(text):
+                    details["इजलास"] = text
+                    found = True
+            elif phase == JUDGES:
+                if text:
+                    if keywords[8].occurs_in(text):
+                        judges.append(text)
+                    elif keywords[7].occurs_in(text) and "मिति" in text:
+                        details["न्यायाधीश"] = judges
+                        details["आदेश मिति"] = text
+                        found = True
+                    else:
+                        details["केस_नम्बर"] = text
+            elif phase == SUBJECT:
+                if keywords[5].occurs_in(text):
+                    details["विषय"] = text
+                    found = True
+            else:
+                group, field = (3, "निवेदक") if phase == APPELLANT else (4, "विपक्षी")
+                if keywords[group].occurs_in(text):
+                    if keywords[group].equals(text):
+                        ind += 1
+                        if ind < n:
+                            text = texts[ind]
+                    details[field] = text
+                    found = True
+
+            ind += 1
+            if found:
+                phase += 1
                 if ind >= n:
-                    ind = temp_ind_32
-                
-                # Extract judges
-                judges = []
-                while ind < n:
-                    text = tags[ind].get_text(separator=' ', strip=True)
-                    if text:
-                        if "न्यायाधीश" in text or "माननीय" in text:
-                            judges.append(text)
-                        elif ("आदेश" in text or "फैसला" in text or "फैसलमा" in text or "निर्णय" in text) and "मिति" in text:
-                            details["न्यायाधीश"] = judges
-                            details["आदेश मिति"] = text
-                            ind += 1
-                            break
-                        else:
+                    ind = 0
+
+        return ind
+
+    def scrape_case_details_2062_to_2072(self, url, mudda_type, sal=None, use_saved=True, html=None):
+        """Scrape details from a single case URL (2062-2072)"""
+        return self._scrape_case_details(url, mudda_type, sal, use_saved, ERA_2062_TO_2072, self._extract_header_2062_to_2072, html)
+
+    def _extract_header_2062_to_2072(self, texts, details):
+        """Read court, judges, dates and parties (2062-2072 layout); return where prakarans start"""
+        n = len(texts)
+        ind = 0
+        temp_ind_32 = ind
+        keywords = KEYWORDS_2062_TO_2072
+
+        # Extract court information
+        temp_ijlash = ""
+        while(ind < n):
+            text = texts[ind]
+            if text:
+                if keywords[6].equals(text):
+                    if "निर्णय नं." not in temp_ijlash:
+                        details["इजलास"] = temp_ijlash
+                    ind+=1
+                    break
+                elif keywords[6].occurs_in(text):
+                    details["इजलास"] = text
+                    ind+=1
+                    text_2 = texts[ind]
+                    if not keywords[8].occurs_in(text_2):
+                        details["इजलास"] = text +" "+ text_2
+                        ind+=1
+                    break
+                elif keywords[8].occurs_in(text):
+                    if "निर्णय नं." not in temp_ijlash:
+                        details["इजलास"] = temp_ijlash
+                    break
+                temp_ijlash = text
+            ind+=1
+
+        if ind >= n:
+            ind = temp_ind_32
+        else:
+            temp_ind_32 = ind
+
+        # Extract judges
+        judges = []
+        faisla_miti_before_case_no = False
+        subject_before_case_no = False
+        while(ind < n):
+            text = texts[ind]
+            if text:
+                if keywords[8].occurs_in(text):
+                    judges.append(text)
+                else:
+                    details["न्यायाधीश"] = judges
+                    if keywords[7].starts(text) and ("मिति" in text or "मिती" in text):
+                        details["आदेश मिति"] = text
+                        ind+=1
+                        faisla_miti_before_case_no = True
+                    elif keywords[10].occurs_in(text):
+                        details["केस_नम्बर"] = text
+                    elif not keywords[3].occurs_in(text) and not keywords[5].occurs_in(text):
+                        if text!="फैसला":
                             details["केस_नम्बर"] = text
-                    ind += 1
+                        else:
+                            ind+=1
+                            details["केस_नम्बर"] = texts[ind]
+                        ind+=1
+                    break
+            ind+=1
 
-                if ind >= n:
-                    ind = temp_ind_32
-                
-                # Standard case structure
-                while ind < n:
-                    text = tags[ind].get_text(separator=' ', strip=True)
-                    if "विषय" in text or "मुद्दा" in text or "बिषय" in text or "मूद्दाः" in text:
+        if ind >= n:
+            ind = temp_ind_32
+        else:
+            temp_ind_32 = ind
+
+        # Standard case structure
+
+        if faisla_miti_before_case_no:
+            while ind < n:
+                text = texts[ind]
+                if text:
+                    if keywords[10].occurs_in(text):
+                        details["केस_नम्बर"] = text
+                    elif keywords[5].starts(text):
+                        subject_before_case_no = True
                         details["विषय"] = text
-                        ind += 1
+                    else:
+                        details["केस_नम्बर"] = text
+                    ind+=1
+                    break
+                ind+=1
+        else:
+            while ind < n:
+                text = texts[ind]
+                if text:
+                    if keywords[7].starts(text) and ("मिति" in text or "मिती" in text):
+                        details["आदेश मिति"] = text
+                        ind+=1
                         break
-                    ind += 1
-
-                if ind >= n:
-                    ind = temp_ind_32
-                    
-                while ind < n:
-                    text = tags[ind].get_text(separator=' ', strip=True)
-                    if any(kw in text for kw in KEYWORDS_3):
-                        if any(kw2 == text for kw2 in KEYWORDS_3):
-                            ind += 1
-                            if ind < n:  # IMPROVEMENT 21: Bounds checking
-                                text = tags[ind].get_text(separator=' ', strip=True)
-                        details["निवेदक"] = text
-                        ind += 1
+                    if keywords[2].starts(text) or text in VERDICT_MARKERS:
+                        ind = temp_ind_32
                         break
-                    ind += 1
+                ind+=1
 
-                if ind >= n:
-                    ind = temp_ind_32
-                    
-                while ind < n:
-                    text = tags[ind].get_text(separator=' ', strip=True)
-                    if any(kw in text for kw in KEYWORDS_4):
-                        if any(kw2 == text for kw2 in KEYWORDS_4):
-                            ind += 1
-                            if ind < n:  # IMPROVEMENT 22: Bounds checking
-                                text = tags[ind].get_text(separator=' ', strip=True)
-                        details["विपक्षी"] = text
-                        ind += 1
-                        break
-                    ind += 1
+        if ind >= n:
+            ind = temp_ind_32
+        else:
+            temp_ind_32 = ind
 
-                if ind >= n:
-                    ind = temp_ind_32
-                
-                # Extract prakarans and tahar
-                prakarans = []
-                prev = ""
+        if subject_before_case_no:
+            while ind < n:
+                text = texts[ind]
+                if text:
+                    details["केस_नम्बर"] = text
+                    ind+=1
+                    break
+                ind+=1
+        else: 
+            while ind < n:
+                text = texts[ind]
+                if text:
+                    if keywords[5].starts(text):
+                        details["विषय"] = text
+                        ind+=1
+                        break
+                    if keywords[3].occurs_in(text):
+                        ind = temp_ind_32
+                        break
+                ind+=1
 
+        if ind >= n:
+            ind = temp_ind_32
+        else:
+            temp_ind_32 = ind
 
-                tahar = []
-                temp_flag_tahar = False
+        temp_ind_64 = ind
+        count_how_many = 0
 
-                for tag in tags[ind:]:
-                    text = tag.get_text(separator=' ', strip=True)
-                    if text:
-                        #if "§" in text or any(kw in text for kw in KEYWORDS_2):
-                            #prakarans.append(text)
-                        if "§" in text or any(kw in text for kw in KEYWORDS_2):
-                            if any(kw in text for kw in KEYWORDS_2):
-                                if prev:  # IMPROVEMENT 23: Only append if prev has content
-                                    prakarans.append(prev)
-                                prev = ""
-                            prakarans.append(text)
-                        else:
-                            prev = prev + " " + text if prev else text
-                        
-                        if text in ["फैसला", "आदेश", "फैसलाः"] or temp_flag_tahar:
-                            temp_flag_tahar = True
-                            tahar.append(text)
-
-                    # Process list items
-                    next_sib = tag.find_next_sibling()
-                    while next_sib and next_sib.name in ['ul', 'ol']:
-                        for li in next_sib.find_all('li'):
-                            li_text = li.get_text(separator=' ', strip=True)
-                            if li_text:
-                                if any(kw in li_text for kw in KEYWORDS_2):
-                                    if prev:  # IMPROVEMENT 24: Only append if prev has content
-                                        prakarans.append(prev)
-                                    prakarans.append(li_text)
-                                    prev = ""
-                                else:
-                                    prev = prev + " " + li_text if prev else li_text
-                                if li_text in ["फैसला", "आदेश", "फैसलाः"] or temp_flag_tahar:
-                                    temp_flag_tahar = True
-                                    tahar.append(li_text)
-                        next_sib = next_sib.find_next_sibling()
-                
-                details["प्रकरण"] = prakarans
-                details["ठहर"] = tahar
+        while temp_ind_64 < n:
+            text = texts[temp_ind_64]
+            if text and keywords[9].equals(text):
+                count_how_many += 1
+            if keywords[2].starts(text):
+                break
+            temp_ind_64+=1
 
-            # Get HTML file path
-            html_file_path = ""
-            if mudda_type and sal:
-                filename = self.generate_html_filename(url, mudda_type, sal)
-                html_file_path = os.path.join(self.html_folder, filename)
-            
-            # Combine all data, handling lists and strings appropriately
-            data = {
-                "लिङ्क": url,
-                "निर्णय नं.": decision_title,
-                "भाग": bhaag or "N/A",  # IMPROVEMENT 25: Handle None values
-                "मुद्दाको किसिम": mudda_type,
-                "साल": saal or "N/A",
-                "महिना": mahina or "N/A",
-                "अंक": anka or "N/A",
-                "फैसला मिति": f"'{decision_date}'",
-                "अदालत / इजलास": details.get("इजलास", "N/A"),
-                "न्यायाधीश": json.dumps(details.get("न्यायाधीश", []), ensure_ascii=False),
-                "आदेश मिति": details.get("आदेश मिति", "N/A"),
-                "केस_नम्बर": json.dumps(details.get("केस_नम्बर", []), ensure_ascii=False) if isinstance(details.get("केस_नम्बर"), list) else details.get("केस_नम्बर", "N/A"),
-                "विषय": details.get("विषय", "N/A"),
-                "निवेदक": json.dumps(details.get("निवेदक", []), ensure_ascii=False) if isinstance(details.get("निवेदक"), list) else details.get("निवेदक", "N/A"),
-                "विपक्षी": json.dumps(details.get("विपक्षी", []), ensure_ascii=False) if isinstance(details.get("विपक्षी"), list) else details.get("विपक्षी", "N/A"),
-                "प्रकरण": json.dumps(details.get("प्रकरण", []), ensure_ascii=False),
-                "ठहर": json.dumps(details.get("ठहर", []), ensure_ascii=False),
-                "html_file_path": html_file_path
-            }
-            
-            # Save to SQLite
-            self.save_to_sqlite(data)
-            print(f"{url} - Successfully Scraped and Entered")
-            return True
-            
-        except Exception as e:
-            print(f"Error scraping {url}: {e}")
-            return False
-    
-    def scrape_case_details_2062_to_2072(self, url, mudda_type, sal = None, use_saved=True):  # CHANGE 4: Remove output_db parameter
-        """Scrape details from a single case URL"""
-        try:
-            # IMPROVEMENT 16: Check if URL already exists in database
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT लिङ्क FROM cases WHERE लिङ्क = ?', (url,))
-            if cursor.fetchone():
-                print(f"URL {url} already exists in database, skipping...")
-                return True
-            # Get soup using saved HTML or web
-            soup = self.return_soup(url, mudda_type, sal, use_saved)
-            if not soup:
-                print(f"Failed to get content for {url}")
-                return False
-            
-            # Extract basic information
-            title_tag = soup.find("h1", class_="post-title")
-            decision_title = title_tag.get_text(strip=True).split()[2] if title_tag and len(title_tag.get_text(strip=True).split()) > 2 else "N/A"  # IMPROVEMENT 19: Bounds checking
-            
-            bhaag = self.get_edition_field(soup, "भाग")
-            saal = self.get_edition_field(soup, "साल")
-            mahina = self.get_edition_field(soup, "महिना")
-            anka = self.get_edition_field(soup, "अंक")
-            
-            # Extract decision date
-            post_meta = soup.find("div", class_="post-meta")
-            decision_date = "N/A"
-            if post_meta and "फैसला मिति" in post_meta.text:
-                try:  # IMPROVEMENT 20: Better error handling for date extraction
-                    decision_date = post_meta.text.strip().split("फैसला मिति :")[-1].split("\n")[0].strip().split()[0]
-                except IndexError:
-                    decision_date = "N/A"
-            
-            # Extract detailed information
-            div_tag = soup.find("div", id="faisala_detail ")
-            details = {}
-            
-            if div_tag:
-                tags = div_tag.find_all(['h1', 'p'])
-                n = len(tags)
-                ind = 0
-                temp_ind_32 = ind
-                KEYWORDS_2 = ["प्रकरण नं.", "(प्रकरण नं", "(प्रकारण नं.", "९प्रकरण नं।", "(प्रकरण", "(प्र नं.","( प्र. नं","(प्र.नं", "(प्र. नं", "( प्रकरण नं.", "( प्रकरणन", "( प्र.नं.", "( प्र . नं .", "( प ्र . नं .", "(प्ररकण नं.", "(प्रकराण नं."]
-                KEYWORDS_3 = ["निवेदक", "वादी", "पुनरावेदक", "निबेदक", "पुनरावदेक", "निवेदिका", "निवेदीका", "निवदेक", "न ि वेदक ः", "नि वेदक ः", "पुनरावेदन", "पुनरवेदिका", "पुनरावेदिका", "पुनरावेदीका", "बादि", "पुनराबेदक", "प्रतिबादी", "पुनरावेक", "अपीलाट", "निवेदनक", "उजुरवाला", "अपिलबाट", "अपिलाट"]
-                KEYWORDS_4 = ["विपक्षी", "प्रतिवादी", "प्रत्यर्थी", "बिपक्षी", "विपक्षी ः", "पिपक्षी", "प्रत्यार्थी", "विपक्ष", "रेस्पोण्डेण्ट", "रेस्पोन्डेन्ट", "प्रत्यथी"]
-                KEYWORDS_5 = ["विषय", "मुद्दा", "बिषय", "मूद्दा", "मुद्द", "मद्दा", "विपक्ष", "मुद्धा", "मुद् दा"]
-                KEYWORDS_6 = ["अदालत", "इजलास", "इजालास", "इजलाश", "बेञ्च"]
-                KEYWORDS_7 = ["आदेश", "फैसला", "फैसलमा", "निर्णय", "फै सला", "मुद्दा"]
-                KEYWORDS_8 = ["न्यायाधीश", "माननीय", "न्यायधीश", "न्यायाधीस", "न्ययाधीश", "न्यायाधिश", "न्यायाधी", "न्यानायधीश", "नयायाधीश", "न्यायाधधिश", "नयाधश"]
-                KEYWORDS_9 = [ "विरूद्ध", "बिरूद्ध", "विरुद्ध", "बिरुद्ध"]
-                KEYWORDS_10 = ["AP", "FN", "RE", "RI", "LE", "RV", "NF", "CI", "CR", "RC", "SA", "MS", "ND", "RB", "CF", "DF", "RF", "WO", "WH", "WS", "WF", "WC", "CC", "EC"]
-                
-                # Extract court information
-                temp_ijlash = ""
-                while(ind < n):
-                    #text = p_tags[ind].get_text(strip=True)
-                    text = tags[ind].get_text(separator=' ', strip=True)
-                    if text:
-                        if any(kw == text for kw in KEYWORDS_6):
-                            if "निर्णय नं." not in temp_ijlash:
-                                details["अदालत / इजलास"] = temp_ijlash
-                            ind+=1
-                            break
-                        elif any(kw in text for kw in KEYWORDS_6):
-                            details["अदालत / इजलास"] = text
-                            ind+=1
-                            text_2 = tags[ind].get_text(separator=' ', strip=True)
-                            if any(kw in text_2 for kw in KEYWORDS_8) == False:
-                                details["अदालत / इजलास"] = text +" "+ text_2
-                                ind+=1
-                            break
-                        elif any(kw in text for kw in KEYWORDS_8):
-                            if "निर्णय नं." not in temp_ijlash:
-                                details["अदालत / इजलास"] = temp_ijlash
-                            break
-                        temp_ijlash = text
-                    ind+=1
 
-                if ind >= n:
-                    ind = temp_ind_32
-                else:
-                    temp_ind_32 = ind
-                
-                # Extract judges
-                judges = []
-                faisla_miti_before_case_no = False
-                subject_before_case_no = False
-                while(ind < n):
-                    #text = p_tags[ind].get_text(strip=True)
-                    text = tags[ind].get_text(separator=' ', strip=True)
-                    if text:
-                        if any(kw in text for kw in KEYWORDS_8):
-                            judges.append(text)
-                        else:
-                            details["न्यायाधीश"] = judges
-                            if any(text.startswith(kw) for kw in KEYWORDS_7) and ("मिति" in text or "मिती" in text):
-                                details["आदेश मिति"] = text
-                                ind+=1
-                                faisla_miti_before_case_no = True
-                            elif any(kw in text for kw in KEYWORDS_10):
-                                details["केस_नम्बर"] = text
-                            elif any(kw2 in text for kw2 in KEYWORDS_3) == False and any(kw2 in text for kw2 in KEYWORDS_5) == False:
-                                if text!="फैसला":
-                                    details["केस_नम्बर"] = text
-                                else:
-                                    ind+=1
-                                    details["केस_नम्बर"] = tags[ind].get_text(separator=' ', strip=True)
-                                ind+=1
-                            break
+        if count_how_many > 1:
+            case_no = []
+            appellant = []
+            opposition = []
+            while count_how_many > 0:
+                while ind < n:
+                    text = texts[ind]
+                    if keywords[3].occurs_in(text):
+                        if keywords[3].equals(text):
+                            ind += 1
+                            text = texts[ind]
+                        appellant.append(text)
+                        ind+=1
+                        break
                     ind+=1
 
                 if ind >= n:
@@ -1213,569 +1428,272 @@ class LegalCaseScraper:
                 else:
                     temp_ind_32 = ind
 
-                # Standard case structure
-
-                if faisla_miti_before_case_no:
-                    while ind < n:
-                        text = tags[ind].get_text(separator=' ', strip=True)
-                        if text:
-                            if any(kw in text for kw in KEYWORDS_10):
-                                details["केस_नम्बर"] = text
-                            elif any(text.startswith(kw) for kw in KEYWORDS_5):
-                                subject_before_case_no = True
-                                details["विषय"] = text
-                            else:
-                                details["केस_नम्बर"] = text
-                            ind+=1
-                            break
-                        ind+=1
-                else:
-                    while ind < n:
-                        text = tags[ind].get_text(separator=' ', strip=True)
-                        if text:
-                            if any(text.startswith(kw) for kw in KEYWORDS_7) and ("मिति" in text or "मिती" in text):
-                                details["आदेश मिति"] = text
-                                ind+=1
-                                break
-                            if any(text.startswith(kw) for kw in KEYWORDS_2) or "फैसला"==text or "आदेश"==text or "फैसलाः"==text:
-                                ind = temp_ind_32
-                                break
+                while ind < n:
+                    text = texts[ind]
+                    if keywords[4].occurs_in(text):
+                        if keywords[4].equals(text):
+                            ind += 1
+                            text = texts[ind]
+                        opposition.append(text)
                         ind+=1
+                        break
+                    ind+=1
 
                 if ind >= n:
                     ind = temp_ind_32
                 else:
                     temp_ind_32 = ind
 
-                if subject_before_case_no:
-                    while ind < n:
-                        text = tags[ind].get_text(separator=' ', strip=True)
-                        if text:
-                            details["केस_नम्बर"] = text
-                            ind+=1
-                            break
-                        ind+=1
-                else: 
-                    while ind < n:
-                        text = tags[ind].get_text(separator=' ', strip=True)
-                        if text:
-                            if any(text.startswith(kw) for kw in KEYWORDS_5):
-                                details["विषय"] = text
-                                ind+=1
-                                break
-                            if any(kw in text for kw in KEYWORDS_3):
-                                ind = temp_ind_32
-                                break
-                        ind+=1
-
-                if ind >= n:
-                    ind = temp_ind_32
-                else:
-                    temp_ind_32 = ind
-                
-                temp_ind_64 = ind
-                count_how_many = 0
-                
-                while temp_ind_64 < n:
-                    text = tags[temp_ind_64].get_text(separator=' ', strip=True)
-                    if text and any(kw == text for kw in KEYWORDS_9):
-                        count_how_many += 1
-                    if any(text.startswith(kw) for kw in KEYWORDS_2):
-                        break
-                    temp_ind_64+=1
-
-
-                if count_how_many > 1:
-                    case_no = []
-                    appellant = []
-                    opposition = []
-                    while count_how_many > 0:
-                        while ind < n:
-                        #text = p_tags[ind].get_text(strip=True)
-                            text = tags[ind].get_text(separator=' ', strip=True)
-                            if any(kw in text for kw in KEYWORDS_3):
-                                if any(kw2 == text for kw2 in KEYWORDS_3):
-                                    ind += 1
-                                    text = tags[ind].get_text(separator=' ', strip=True)
-                                appellant.append(text)
-                                ind+=1
-                                break
-                            ind+=1
-                    
-                        if ind >= n:
-                            ind = temp_ind_32
-                        else:
-                            temp_ind_32 = ind
-                    
-                        while ind < n:
-                                #text = p_tags[ind].get_text(strip=True)
-                            text = tags[ind].get_text(separator=' ', strip=True)
-                            if any(kw in text for kw in KEYWORDS_4):
-                                if any(kw2 == text for kw2 in KEYWORDS_4):
-                                    ind += 1
-                                    text = tags[ind].get_text(separator=' ', strip=True)
-                                opposition.append(text)
-                                ind+=1
-                                break
-                            ind+=1
-                            
-                        if ind >= n:
-                            ind = temp_ind_32
-                        else:
-                            temp_ind_32 = ind
+                count_how_many-=1
 
-                        count_how_many-=1
-                        
-                    temp_ind_128 = 0
-                    
-                    while temp_ind_128 < n:
-                        text = tags[temp_ind_128].get_text(separator=' ', strip=True)
-                        if text:
-                            if any(kw in text for kw in KEYWORDS_10):
-                                case_no.append(text)
-                            if any(text.startswith(kw) for kw in KEYWORDS_2) or any(kw == text for kw in KEYWORDS_7):
-                                break
-                        temp_ind_128 += 1
-
-                    details["केस_नम्बर"] = case_no
-                    details["निवेदक"] = appellant
-                    details["विपक्षी"] = opposition
-
-                else:
-                    while ind < n:
-                        text = tags[ind].get_text(separator=' ', strip=True)
-                        if any(kw in text for kw in KEYWORDS_3):
-                            if any(kw2 == text for kw2 in KEYWORDS_3):
-                                ind += 1
-                                text = tags[ind].get_text(separator=' ', strip=True)
-                            details["निवेदक"] = text
-                            ind+=1
-                            break
-                        ind+=1 
-
-                    if ind >= n:
-                        ind = temp_ind_32
-                    else:
-                        temp_ind_32 = ind
-
-                    while ind < n:
-                        #text = p_tags[ind].get_text(strip=True)
-                        text = tags[ind].get_text(separator=' ', strip=True)
-                        if any(kw in text for kw in KEYWORDS_4):
-                            if any(kw2 == text for kw2 in KEYWORDS_4):
-                                ind += 1
-                                text = tags[ind].get_text(separator=' ', strip=True)
-                            details["विपक्षी"] = text
-                            ind+=1
-                            break
-                        ind+=1
-
-                    if ind >= n:
-                        ind = temp_ind_32
-                    else:
-                        temp_ind_32 = ind
-                
-                
-                # Extract prakarans and tahar
-                prakarans = []
-                prev = ""
+            temp_ind_128 = 0
 
+            while temp_ind_128 < n:
+                text = texts[temp_ind_128]
+                if text:
+                    if keywords[10].occurs_in(text):
+                        case_no.append(text)
+                    if keywords[2].starts(text) or keywords[7].equals(text):
+                        break
+                temp_ind_128 += 1
 
-                tahar = []
-                temp_flag_tahar = False
+            details["केस_नम्बर"] = case_no
+            details["निवेदक"] = appellant
+            details["विपक्षी"] = opposition
 
-                for tag in tags[ind:]:
-                    text = tag.get_text(separator=' ', strip=True)
-                    if text:
-                        #if "§" in text or any(kw in text for kw in KEYWORDS_2):
-                            #prakarans.append(text)
-                        if "§" in text or any(text.startswith(kw) for kw in KEYWORDS_2) or "फैसला"==text or "आदेश"==text or "फैसलाः"==text:
-                            if any(text.startswith(kw) for kw in KEYWORDS_2):
-                                if prev:  # IMPROVEMENT 23: Only append if prev has content
-                                    prakarans.append(prev)
-                                prakarans.append(text)
-                                prev = ""
-                            if "§" in text:
-                                prakarans.append(text)
-                            if "फैसला"==text or "आदेश"==text or "फैसलाः"==text:
-                                if not prakarans:
-                                    prakarans.append(prev)
-                        else:
-                            prev = prev + " " + text if prev else text
-                        
-                        if text in ["फैसला", "आदेश", "फैसलाः"] or temp_flag_tahar:
-                            temp_flag_tahar = True
-                            tahar.append(text)
-
-                    # Process list items
-                    next_sib = tag.find_next_sibling()
-                    while next_sib and next_sib.name in ['ul', 'ol']:
-                        for li in next_sib.find_all('li'):
-                            li_text = li.get_text(separator=' ', strip=True)
-                            if li_text:
-                                if any(li_text.startswith(kw) for kw in KEYWORDS_2):
-                                    if prev:  # IMPROVEMENT 24: Only append if prev has content
-                                        prakarans.append(prev)
-                                    prakarans.append(li_text)
-                                    prev = ""
-                                else:
-                                    prev = prev + " " + li_text if prev else li_text
-                                if li_text in ["फैसला", "आदेश", "फैसलाः"] or temp_flag_tahar:
-                                    temp_flag_tahar = True
-                                    tahar.append(li_text)
-                        next_sib = next_sib.find_next_sibling()
-                
-                details["प्रकरण"] = prakarans
-                details["ठहर"] = tahar
+        else:
+            while ind < n:
+                text = texts[ind]
+                if keywords[3].occurs_in(text):
+                    if keywords[3].equals(text):
+                        ind += 1
+                        text = texts[ind]
+                    details["निवेदक"] = text
+                    ind+=1
+                    break
+                ind+=1 
 
-            # Get HTML file path
-            html_file_path = ""
-            if mudda_type and sal:
-                filename = self.generate_html_filename(url, mudda_type, sal)
-                html_file_path = os.path.join(self.html_folder, filename)
-            
-            # Combine all data, handling lists and strings appropriately
-            data = {
-                "लिङ्क": url,
-                "निर्णय नं.": decision_title,
-                "भाग": bhaag or "N/A",  # IMPROVEMENT 25: Handle None values
-                "मुद्दाको किसिम": mudda_type,
-                "साल": saal or "N/A",
-                "महिना": mahina or "N/A",
-                "अंक": anka or "N/A",
-                "फैसला मिति": f"'{decision_date}'",
-                "अदालत / इजलास": details.get("अदालत / इजलास", "N/A"),
-                "न्यायाधीश": json.dumps(details.get("न्यायाधीश", []), ensure_ascii=False),
-                "आदेश मिति": details.get("आदेश मिति", "N/A"),
-                "केस_नम्बर": json.dumps(details.get("केस_नम्बर", []), ensure_ascii=False) if isinstance(details.get("केस_नम्बर"), list) else details.get("केस_नम्बर", "N/A"),
-                "विषय": details.get("विषय", "N/A"),
-                "निवेदक": json.dumps(details.get("निवेदक", []), ensure_ascii=False) if isinstance(details.get("निवेदक"), list) else details.get("निवेदक", "N/A"),
-                "विपक्षी": json.dumps(details.get("विपक्षी", []), ensure_ascii=False) if isinstance(details.get("विपक्षी"), list) else details.get("विपक्षी", "N/A"),
-                "प्रकरण": json.dumps(details.get("प्रकरण", []), ensure_ascii=False),
-                "ठहर": json.dumps(details.get("ठहर", []), ensure_ascii=False),
-                "html_file_path": html_file_path
-            }
-            
-            # Save to SQLite
-            self.save_to_sqlite(data)
-            print(f"{url} - Successfully Scraped and Entered")
-            return True
-            
-        except Exception as e:
-            print(f"Error scraping {url}: {e}")
-            return False
+            if ind >= n:
+                ind = temp_ind_32
+            else:
+                temp_ind_32 = ind
 
-    def scrape_case_details_2073_to_2080(self, url, mudda_type, sal = None, use_saved=True):
-        """Scrape details from a single case URL"""
-        try:
-            r = requests.get(url, timeout=15)
-            if r.status_code != 200:
-                print(f"Failed to retrieve {url}, Status code: {r.status_code}")
-                return False
+            while ind < n:
+                text = texts[ind]
+                if keywords[4].occurs_in(text):
+                    if keywords[4].equals(text):
+                        ind += 1
+                        text = texts[ind]
+                    details["विपक्षी"] = text
+                    ind+=1
+                    break
+                ind+=1
 
-            # Get soup using saved HTML or web
-            soup = self.return_soup(url, mudda_type, sal, use_saved)
-            if not soup:
-                print(f"Failed to get content for {url}")
-                return False
-            
-            # Extract basic information
-            title_tag = soup.find("h1", class_="post-title")
-            decision_title = title_tag.get_text(strip=True).split()[2] if title_tag else "N/A"
-            
-            bhaag = self.get_edition_field(soup, "भाग")
-            saal = self.get_edition_field(soup, "साल")
-            mahina = self.get_edition_field(soup, "महिना")
-            anka = self.get_edition_field(soup, "अंक")
-            
-            # Extract decision date
-            post_meta = soup.find("div", class_="post-meta")
-            decision_date = "N/A"
-            if post_meta and "फैसला मिति" in post_meta.text:
-                decision_date = post_meta.text.strip().split("फैसला मिति :")[-1].split("\n")[0].strip().split()[0]
-            
-            # Extract detailed information
-            div_tag = soup.find("div", id="faisala_detail ")
-            details = {}
-            
-            if div_tag:
-                p_tags = div_tag.find_all('p')
-                n = len(p_tags)
-                ind = 0
+            if ind >= n:
+                ind = temp_ind_32
+            else:
                 temp_ind_32 = ind
-                KEYWORDS_2 = ["(प्रकरण नं", "(प्रकारण नं.", "९प्रकरण नं।", "(प्रकरण", "(प्र.नं."]
-                # Extract court information
+
+        return ind
+
+    def scrape_case_details_2073_to_2080(self, url, mudda_type, sal=None, use_saved=True, html=None):
+        """Scrape details from a single case URL (2073-2080)"""
+        return self._scrape_case_details(url, mudda_type, sal, use_saved, ERA_2073_TO_2080, self._extract_header_2073_to_2080, html)
+
+    def _extract_header_2073_to_2080(self, texts, details):
+        """Read court, judges, dates and parties (2073-2080 layout); return where prakarans start"""
+        n = len(texts)
+        ind = 0
+        temp_ind_32 = ind
+        keywords = KEYWORDS_2073_TO_2080
+        # Extract court information
+        while ind < n:
+            text = texts[ind]
+            if text and "अदालत" in text:
+                details["इजलास"] = text
+                ind += 1
+                break
+            ind += 1
+
+        if ind >= n:
+            ind = temp_ind_32
+
+        # Extract judges
+        judges = []
+        while ind < n:
+            text = texts[ind]
+            if text:
+                if "न्यायाधीश" in text:
+                    judges.append(text)
+                if keywords[7].occurs_in(text):
+                    details["न्यायाधीश"] = judges
+                    details["आदेश मिति"] = text
+                    ind += 1
+                    break
+            ind += 1
+
+        if ind >= n:
+            ind = temp_ind_32
+
+        # Extract case details
+        bisaya_before_kas_no = False
+        while ind < n:
+            text = texts[ind]
+            if text:
+                if keywords[5].occurs_in(text):
+                    bisaya_before_kas_no = True
+                    details["विषय"] = text
+                    ind += 1
+                    break
+                details["केस_नम्बर"] = text
+                break
+            ind += 1
+
+        if ind > n:
+            ind = temp_ind_32
+
+        # Handle different case structures
+        if bisaya_before_kas_no:
+            case_no = []
+            appellant = []
+            opposition = []
+            temp_flag = True
+
+            while temp_flag and ind < n:
+                # Extract case number
                 while ind < n:
-                    text = p_tags[ind].get_text(strip=True)
-                    if text and "अदालत" in text:
-                        details["अदालत"] = text
+                    text = texts[ind]
+                    if text:
+                        case_no.append(text)
                         ind += 1
                         break
                     ind += 1
 
-                if ind >= n:
-                    ind = temp_ind_32
-                
-                # Extract judges
-                judges = []
+                # Extract appellant
                 while ind < n:
-                    text = p_tags[ind].get_text(strip=True)
-                    if text:
-                        if "न्यायाधीश" in text:
-                            judges.append(text)
-                        if "आदेश मिति" in text or "फैसला मिति" in text:
-                            details["न्यायाधीश"] = judges
-                            details["आदेश मिति"] = text
-                            ind += 1
-                            break
+                    text = texts[ind]
+                    if keywords[3].occurs_in(text):
+                        appellant.append(text)
+                        ind += 1
+                        break
                     ind += 1
 
-                if ind >= n:
-                    ind = temp_ind_32
-                
-                # Extract case details
-                bisaya_before_kas_no = False
+                # Extract opposition
                 while ind < n:
-                    text = p_tags[ind].get_text(strip=True)
-                    if text:
-                        if "विषय" in text or "मुद्दा" in text:
-                            bisaya_before_kas_no = True
-                            details["विषय"] = text
-                            ind += 1
-                            break
-                        details["केस_नम्बर"] = text
+                    text = texts[ind]
+                    if keywords[4].occurs_in(text):
+                        opposition.append(text)
+                        ind += 1
                         break
                     ind += 1
 
-                if ind > n:
-                    ind = temp_ind_32
-                
-                # Handle different case structures
-                if bisaya_before_kas_no:
-                    case_no = []
-                    appellant = []
-                    opposition = []
-                    temp_flag = True
-                    
-                    while temp_flag and ind < n:
-                        # Extract case number
-                        while ind < n:
-                            text = p_tags[ind].get_text(strip=True)
-                            if text:
-                                case_no.append(text)
-                                ind += 1
-                                break
-                            ind += 1
-                        
-                        # Extract appellant
-                        while ind < n:
-                            text = p_tags[ind].get_text(strip=True)
-                            if "निवेदक" in text or "प्रतिवादी" in text or "पुनरावेदक" in text:
-                                appellant.append(text)
-                                ind += 1
-                                break
-                            ind += 1
-                        
-                        # Extract opposition
-                        while ind < n:
-                            text = p_tags[ind].get_text(strip=True)
-                            if "विपक्षी" in text or "वादी" in text or "प्रत्यर्थी" in text:
-                                opposition.append(text)
-                                ind += 1
-                                break
-                            ind += 1
-                        
-                        # Check for end condition
-                        temp_ind = ind
-                        for tag in p_tags[temp_ind:]:
-                            text = tag.get_text(strip=True)
-                            if "(प्रकरण नं" in text or "(प्रकारण नं." in text or "९प्रकरण नं।" in text or "(प्रकरण" in text:
-                                temp_flag = False
-                                details["केस_नम्बर"] = case_no
-                                details["निवेदक"] = appellant
-                                details["विपक्षी"] = opposition
-                                break
-                            elif "विरूद्ध"== text:
-                                break
-
-                    if ind >= n:
-                        ind = temp_ind_32
-                else:
-                    # Standard case structure
-                    while ind < n:
-                        text = p_tags[ind].get_text(strip=True)
-                        if "विषय" in text or "मुद्दा" in text:
-                            details["विषय"] = text
-                            ind += 1
-                            break
-                        ind += 1
+                # Check for end condition, without copying the remaining texts
+                for text in islice(texts, ind, None):
+                    if keywords[11].occurs_in(text):
+                        temp_flag = False
+                        details["केस_नम्बर"] = case_no
+                        details["निवेदक"] = appellant
+                        details["विपक्षी"] = opposition
+                        break
+                    elif "विरूद्ध"== text:
+                        break
 
-                    if ind >= n:
-                        ind = temp_ind_32
-                    
-                    while ind < n:
-                        text = p_tags[ind].get_text(strip=True)
-                        if "निवेदक" in text or "प्रतिवादी" in text or "पुनरावेदक" in text:
-                            details["निवेदक"] = text
-                            ind += 1
-                            break
-                        ind += 1
+            if ind >= n:
+                ind = temp_ind_32
+        else:
+            # Standard case structure
+            while ind < n:
+                text = texts[ind]
+                if keywords[5].occurs_in(text):
+                    details["विषय"] = text
+                    ind += 1
+                    break
+                ind += 1
 
-                    if ind >= n:
-                        ind = temp_ind_32
-                    
-                    while ind < n:
-                        text = p_tags[ind].get_text(strip=True)
-                        if "विपक्षी" in text or "वादी" in text or "प्रत्यर्थी" in text:
-                            details["विपक्षी"] = text
-                            ind += 1
-                            break
-                        ind += 1
+            if ind >= n:
+                ind = temp_ind_32
 
-                    if ind >= n:
-                        ind = temp_ind_32
-                
-                # Clean up extracted text
-                # self.clean_extracted_details(details, bisaya_before_kas_no)
-                
-                # Extract prakarans and tahar
-                prakarans = []
-                prev = ""
-                tahar = []
-                temp_flag_tahar = False
-
-                for tag in p_tags[ind:]:
-                    text = tag.get_text(strip=True)
-                    if text:
-                        if any(kw in text for kw in KEYWORDS_2):
-                            prakarans.append(prev)
-                            prakarans.append(text)
-                            prev = ""
-                        else:
-                            prev = prev + " " + text if prev else text
-                        
-                        if "फैसला"==text or "आदेश"==text or temp_flag_tahar:
-                            temp_flag_tahar = True
-                            tahar.append(text)
-
-
-                    # --- Inserted check for <li> inside following siblings ---
-                    next_sib = tag.find_next_sibling()
-                    while next_sib and next_sib.name in ['ul', 'ol']:
-                        # Loop through all <li> inside this list
-                        for li in next_sib.find_all('li'):
-                            li_text = li.get_text(strip=True)
-                            if li_text:
-                                #print(li_text)
-                                if any(kw in li_text for kw in KEYWORDS_2):
-                                    prakarans.append(prev)
-                                    prakarans.append(li_text)
-                                    prev = ""
-                                else:
-                                    if prev:
-                                        prev = prev + " " + li_text
-                                    else:
-                                        prev = prev + li_text
-                                if "फैसला" == li_text or "आदेश" == li_text or temp_flag_tahar:
-                                    temp_flag_tahar = True
-                                    tahar.append(li_text)
-                        # Move to next sibling in case multiple lists follow
-                        next_sib = next_sib.find_next_sibling()
-                
-                details["प्रकरण"] = prakarans
-                details["ठहर"] = tahar
+            while ind < n:
+                text = texts[ind]
+                if keywords[3].occurs_in(text):
+                    details["निवेदक"] = text
+                    ind += 1
+                    break
+                ind += 1
 
-            # Get HTML file path
-            html_file_path = ""
-            if mudda_type and sal:
-                filename = self.generate_html_filename(url, mudda_type, sal)
-                html_file_path = os.path.join(self.html_folder, filename)
-            
-            # Combine all data, handling lists and strings appropriately
-            data = {
-                "लिङ्क": url,
-                "निर्णय नं.": decision_title,
-                "भाग": bhaag,
-                "मुद्दाको किसिम": mudda_type,
-                "साल": saal,
-                "महिना": mahina,
-                "अंक": anka,
-                "फैसला मिति": f"'{decision_date}'",
-                "अदालत / इजलास": details.get("अदालत", "N/A"),
-                "न्यायाधीश": json.dumps(details.get("न्यायाधीश", []), ensure_ascii=False),
-                "आदेश मिति": details.get("आदेश मिति", "N/A"),
-                "केस_नम्बर": json.dumps(details.get("केस_नम्बर", []), ensure_ascii=False) if isinstance(details.get("केस_नम्बर"), list) else details.get("केस_नम्बर", "N/A"),
-                "विषय": details.get("विषय", "N/A"),
-                "निवेदक": json.dumps(details.get("निवेदक", []), ensure_ascii=False) if isinstance(details.get("निवेदक"), list) else details.get("निवेदक", "N/A"),
-                "विपक्षी": json.dumps(details.get("विपक्षी", []), ensure_ascii=False) if isinstance(details.get("विपक्षी"), list) else details.get("विपक्षी", "N/A"),
-                "प्रकरण": json.dumps(details.get("प्रकरण", []), ensure_ascii=False),
-                "ठहर": json.dumps(details.get("ठहर", []), ensure_ascii=False),
-                "html_file_path": html_file_path
-            }
-            
-            # Save to SQLite
-            self.save_to_sqlite(data)
-            print(f"{url} - Successfully Scraped and Entered")
-            return True
-            
-        except Exception as e:
-            print(f"Error scraping {url}: {e}")
-            return False
+            if ind >= n:
+                ind = temp_ind_32
 
-    # Similar modifications would be made to other scraper methods...
-    # For brevity, I'll include just the generic pattern and key methods
-
-##    def scrape_case_details_2062_to_2072(self, url, mudda_type, sal=None, use_saved=True):
-##        """Scrape details from a single case URL (2062-2072) - Similar structure to above"""
-##        # Implementation similar to 2015_to_2044 but with year-specific parsing logic
-##        # This would follow the same pattern with HTML file handling
-##        pass
-##
-##    def scrape_case_details_2073_to_2080(self, url, mudda_type, sal=None, use_saved=True):
-##        """Scrape details from a single case URL (2073-2080) - Similar structure to above"""
-##        # Implementation similar to 2015_to_2044 but with year-specific parsing logic
-##        # This would follow the same pattern with HTML file handling
-##        pass
-
-    def save_to_sqlite(self, data):
-        """Save data to SQLite database"""
-        cursor = self.conn.cursor()
+            while ind < n:
+                text = texts[ind]
+                if keywords[4].occurs_in(text):
+                    details["विपक्षी"] = text
+                    ind += 1
+                    break
+                ind += 1
+
+            if ind >= n:
+                ind = temp_ind_32
+
+        return ind
+
+    def page_digest(self, html, mudda_type, sal):
+        """Fingerprint of a case page and everything else its parsed row depends on"""
+        key = f"{PARSER_VERSION}\0{mudda_type}\0{sal}\0{html}"
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+    def save_to_sqlite(self, data, page_digest=None):
+        """Queue a scraped case for insertion; rows are written in batches"""
+        self._pending_cases.append((
+            data["लिङ्क"], data["निर्णय नं."], data["भाग"], data["मुद्दाको किसिम"],
+            data["साल"], data["महिना"], data["अंक"], data["फैसला मिति"],
+            data["अदालत / इजलास"], data["न्यायाधीश"], data["आदेश मिति"], data["केस_नम्बर"],
+            data["विषय"], data["निवेदक"], data["विपक्षी"], data["प्रकरण"], data["ठहर"],
+            data["html_file_path"]
+        ))
+        if page_digest:
+            self._pending_digests.append((data["लिङ्क"], page_digest))
+        # A batch that fails to write stays queued and is retried once another
+        # BATCH_SIZE cases have been added (and again on close); the failure
+        # is not this case's, so it is not passed on to the caller
+        if len(self._pending_cases) % BATCH_SIZE == 0:
+            try:
+                self.flush()
+            except sqlite3.Error:
+                print(f"Keeping {len(self._pending_cases)} cases queued for the next write")
+
+    def flush(self):
+        """Write all queued cases to SQLite in a single transaction"""
+        if not self._pending_cases:
+            return
         
         try:
-            cursor.execute('''
-                INSERT OR REPLACE INTO cases (
-                    लिङ्क, निर्णय_नं, भाग, मुद्दाको_किसिम, साल, महिना, अंक, फैसला_मिति,
-                    अदालत_वा_इजलास, न्यायाधीश, आदेश_मिति, केस_नम्बर, विषय, निवेदक, विपक्षी, 
-                    प्रकरण, ठहर, html_file_path
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                data["लिङ्क"], data["निर्णय नं."], data["भाग"], data["मुद्दाको किसिम"],
-                data["साल"], data["महिना"], data["अंक"], data["फैसला मिति"],
-                data["अदालत / इजलास"], data["न्यायाधीश"], data["आदेश मिति"], data["केस_नम्बर"],
-                data["विषय"], data["निवेदक"], data["विपक्षी"], data["प्रकरण"], data["ठहर"],
-                data["html_file_path"]
-            ))
-            self.conn.commit()
+            with self.conn:
+                self.conn.executemany(INSERT_CASE_SQL, self._pending_cases)
+                self.conn.executemany(
+                    'INSERT OR REPLACE INTO parsed_pages (लिङ्क, html_digest) VALUES (?, ?)',
+                    self._pending_digests
+                )
+            # Links count as stored only once their batch is committed
+            self._known_links.update(row[0] for row in self._pending_cases)
+            self._page_digests.update(self._pending_digests)
+            self._pending_cases.clear()
+            self._pending_digests.clear()
         except sqlite3.Error as e:
             print(f"Database error: {e}")
             raise
     
     def save_failed_links(self, failed_links, mudda_type, sal, error_msg="Unknown error"):
-        """Save failed links to SQLite database"""
+        """Save failed links to SQLite database in a single transaction"""
         if failed_links:
-            cursor = self.conn.cursor()
-            for link in failed_links:
-                try:
-                    cursor.execute('''
+            try:
+                with self.conn:
+                    self.conn.executemany('''
                         INSERT INTO failed_links (मुद्दाको_किसिम, साल, लिङ्क, error_message, retry_count)
                         VALUES (?, ?, ?, ?, ?)
-                    ''', (mudda_type, sal, link, error_msg, 1))
-                except sqlite3.Error as e:
-                    print(f"Error saving failed link {link}: {e}")
-            try:
-                self.conn.commit()
+                    ''', [(mudda_type, sal, link, error_msg, 1) for link in failed_links])
             except sqlite3.Error as e:
-                print(f"Error committing failed links: {e}")
+                print(f"Error saving failed links: {e}")
 
     def test_single_link(self, url, mudda_type=None, sal=None, use_saved=True):
         """Test scraping a single link"""
@@ -1795,6 +1713,7 @@ class LegalCaseScraper:
             print("Using generic scraping without HTML file management")
         
         success = self.scrape_case_details_generic(url, mudda_type, sal, use_saved)
+        self.flush()
         if success:
             print("✓ Successfully scraped and saved to database")
         else:
@@ -1819,31 +1738,72 @@ class LegalCaseScraper:
         successful_count = 0
         failed_count = 0
         
-        for html_file in html_files:
-            file_mudda_type, file_sal, link_number = self.extract_info_from_filename(html_file)
-            
-            if not file_mudda_type or not file_sal:
-                print(f"Could not extract info from filename: {html_file}")
-                failed_count += 1
-                continue
-            
-            # Reconstruct URL (this is a simplified approach)
-            url = f"https://nkp.gov.np/full_detail/{link_number}"
-            
-            print(f"Testing {html_file} -> {file_mudda_type}, {file_sal}")
+        def saved_cases():
+            nonlocal failed_count
+            for html_file in html_files:
+                file_mudda_type, file_sal, link_number = self.extract_info_from_filename(html_file)
+                
+                if not file_mudda_type or not file_sal:
+                    print(f"Could not extract info from filename: {html_file}")
+                    failed_count += 1
+                    continue
+                
+                # Reconstruct URL (this is a simplified approach)
+                yield f"https://nkp.gov.np/full_detail/{link_number}", file_mudda_type, file_sal
+        
+        # Worker threads read and decompress upcoming files while this one parses
+        for url, file_mudda_type, file_sal, html in self.prefetched_cases(saved_cases()):
+            print(f"Testing {url} -> {file_mudda_type}, {file_sal}")
             
-            success = self.scrape_case_details_generic(url, file_mudda_type, file_sal, use_saved=True)
+            success = self.scrape_case_details_generic(url, file_mudda_type, file_sal, use_saved=True, html=html)
             
             if success:
                 successful_count += 1
             else:
                 failed_count += 1
         
+        self.flush()
         print(f"\nTest Results:")
         print(f"✓ Successful: {successful_count}")
         print(f"✗ Failed: {failed_count}")
         print(f"Total: {len(html_files)}")
 
+    def scrape_links(self, urls, mudda_type, sal, use_saved=True, action="Processing", total=None):
+        """Scrape case links in order through the prefetch pipeline; return (links seen, failed links)"""
+        count = 0
+        failed_links = []
+        
+        cases = ((url, mudda_type, sal) for url in urls)
+        for url, _, _, html in self.prefetched_cases(cases, use_saved):
+            count += 1
+            progress = f"{count}/{total}" if total else count
+            print(f"{action} {progress}: {url}")
+            
+            if not self.scrape_case_details_generic(url, mudda_type, sal, use_saved, html=html):
+                failed_links.append(url)
+        
+        return count, failed_links
+
+    def prefetched_cases(self, cases, use_saved=True):
+        """Yield (url, mudda_type, sal, html) for each (url, mudda_type, sal) case, in order"""
+        # Worker threads fetch upcoming pages while the caller parses and
+        # writes, keeping at most PREFETCH_DEPTH pages in flight
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            remaining_cases = iter(cases)
+            pending = deque()
+            
+            def submit(case):
+                pending.append((case, executor.submit(self.prefetch_case_html, *case, use_saved)))
+            
+            for case in islice(remaining_cases, PREFETCH_DEPTH):
+                submit(case)
+            
+            while pending:
+                case, future = pending.popleft()
+                for next_case in islice(remaining_cases, 1):
+                    submit(next_case)
+                yield (*case, future.result())
+
     def run_scraper(self, mudda_type, sal, use_saved=True):
         """Main method to run the scraper"""
         print(f"Starting scraper for mudda_type: {mudda_type}, sal: {sal}")
@@ -1863,55 +1823,33 @@ class LegalCaseScraper:
             print(f"Error generating search URL: {e}")
             return
         
-        # Get all case URLs
-        print("Fetching all case URLs...")
-        case_urls = self.get_all_pages(search_url, mudda_type, sal, use_saved)
+        # Case URLs stream in as result pages are read, so scraping starts
+        # with the first page instead of after the whole search
+        print("Fetching case URLs...")
+        remaining_urls = self.iter_case_links(search_url, mudda_type, sal, use_saved)
         
-        if not case_urls:
+        # Scrape each case
+        found_count, failed_links = self.scrape_links(remaining_urls, mudda_type, sal, use_saved)
+        if not found_count:
             print("No case URLs found!")
             return
-        
-        print(f"Found {len(case_urls)} case URLs to scrape")
-        
-        # Scrape each case
-        successful_count = 0
-        failed_links = []
-        
-        for i, url in enumerate(case_urls, 1):
-            print(f"Processing {i}/{len(case_urls)}: {url}")
-            
-            success = self.scrape_case_details_generic(url, mudda_type, sal, use_saved)
-            if success:
-                successful_count += 1
-            else:
-                failed_links.append(url)
-            
-            # Add delay between requests only if downloading from web
-            if not use_saved:
-                time.sleep(2)
+        successful_count = found_count - len(failed_links)
         
         # Retry failed links once
         if failed_links:
             print(f"\nRetrying {len(failed_links)} failed links...")
-            still_failed = []
-            
-            for i, url in enumerate(failed_links, 1):
-                print(f"Retrying {i}/{len(failed_links)}: {url}")
-                
-                success = self.scrape_case_details_generic(url, mudda_type, sal, use_saved=False)  # Force web download on retry
-                if success:
-                    successful_count += 1
-                else:
-                    still_failed.append(url)
-                
-                time.sleep(2)
+            # Force web download on retry
+            retried_count, still_failed = self.scrape_links(
+                failed_links, mudda_type, sal, use_saved=False, action="Retrying", total=len(failed_links)
+            )
+            successful_count += retried_count - len(still_failed)
             
             # Save permanently failed links
             if still_failed:
                 self.save_failed_links(still_failed, mudda_type, sal, "Failed after retry")
                 
                 print(f"\nFinal Results:")
-                print(f"Total links found: {len(case_urls)}")
+                print(f"Total links found: {found_count}")
                 print(f"Successfully scraped: {successful_count}")
                 print(f"Failed to scrape: {len(still_failed)}")
                 
@@ -1919,21 +1857,55 @@ class LegalCaseScraper:
                     print(f"Failed links saved to database: failed_links table")
         else:
             print(f"\nResults:")
-            print(f"Total links found: {len(case_urls)}")
+            print(f"Total links found: {found_count}")
             print(f"Successfully scraped: {successful_count}")
         
+        self.flush()
         print(f"Scraped data saved to SQLite database: {self.output_db}")
 
     def close(self):
-        """Explicitly close the database connection"""
-        if hasattr(self, 'conn'):
-            self.conn.close()
-
-    def __del__(self):
-        """Close SQLite connection when the object is destroyed"""
+        """Write any queued cases and close the database and HTTP connections"""
+        if self.conn is not None:
+            try:
+                self.flush()
+                # Refresh query planner statistics while the data is fresh
+                self.conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                print(f"{len(self._pending_cases)} scraped cases could not be saved")
+            finally:
+                self.conn.close()
+                self.conn = None
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
         self.close()
 
 
+def positive_int(value):
+    """argparse type for a whole number greater than 0"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0: {value}")
+    return number
+
+
+def positive_float(value):
+    """argparse type for a number greater than 0"""
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number: {value!r}")
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0: {value}")
+    return number
+
+
 def create_parser():
     """Create command line argument parser"""
     parser = argparse.ArgumentParser(
@@ -1982,6 +1954,12 @@ Examples:
     parser.add_argument('--limit', type=int,
                        help='Limit number of files to test (use with --test_saved)')
     
+    parser.add_argument('--workers', type=positive_int, default=MAX_WORKERS,
+                       help=f'Number of pages fetched concurrently (default: {MAX_WORKERS})')
+    
+    parser.add_argument('--rate', type=positive_float, default=REQUESTS_PER_SECOND,
+                       help=f'Maximum requests started per second (default: {REQUESTS_PER_SECOND})')
+    
     parser.add_argument('--list_mudda_types', action='store_true',
                        help='List all available mudda types')
     
@@ -1995,55 +1973,52 @@ def main():
     
     # List mudda types if requested
     if args.list_mudda_types:
-        temp_scraper = LegalCaseScraper()
         print("Available mudda_type options:")
-        for i, option in enumerate(temp_scraper.mudda_type_arr, 1):
+        for i, option in enumerate(LegalCaseScraper.mudda_type_arr, 1):
             print(f"{i}. {option}")
-        temp_scraper.close()
         return
     
-    # Create the scraper
-    scraper = LegalCaseScraper(
+    # Create the scraper; leaving the with block flushes queued cases and closes it
+    with LegalCaseScraper(
         output_db=args.database_name,
-        html_folder=args.html_folder
-    )
-    
-    try:
-        # Test single link
-        if args.test_link:
-            success = scraper.test_single_link(
-                args.test_link, 
-                args.mudda_type, 
-                args.nepali_year,
-                use_saved=args.use_saved
-            )
-            return
+        html_folder=args.html_folder,
+        max_workers=args.workers,
+        rate=args.rate
+    ) as scraper:
+        try:
+            # Test single link
+            if args.test_link:
+                success = scraper.test_single_link(
+                    args.test_link, 
+                    args.mudda_type, 
+                    args.nepali_year,
+                    use_saved=args.use_saved
+                )
+                return
         
-        # Test saved HTML files
-        if args.test_saved:
-            scraper.test_saved_html_files(
+            # Test saved HTML files
+            if args.test_saved:
+                scraper.test_saved_html_files(
+                    mudda_type=args.mudda_type,
+                    sal=args.nepali_year,
+                    limit=args.limit
+                )
+                return
+        
+            # Regular scraping
+            if not args.mudda_type or not args.nepali_year:
+                print("Error: --mudda_type and --nepali_year are required for scraping")
+                print("Use --help for usage examples")
+                return
+        
+            scraper.run_scraper(
                 mudda_type=args.mudda_type,
                 sal=args.nepali_year,
-                limit=args.limit
+                use_saved=args.use_saved
             )
-            return
-        
-        # Regular scraping
-        if not args.mudda_type or not args.nepali_year:
-            print("Error: --mudda_type and --nepali_year are required for scraping")
-            print("Use --help for usage examples")
-            return
         
-        scraper.run_scraper(
-            mudda_type=args.mudda_type,
-            sal=args.nepali_year,
-            use_saved=args.use_saved
-        )
-        
-    except Exception as e:
-        print(f"Error: {e}")
-    finally:
-        scraper.close()
+        except Exception as e:
+            print(f"Error: {e}")
 
 
 if __name__ == "__main__":